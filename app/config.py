@@ -4,10 +4,29 @@ Loads settings from environment variables with sensible defaults.
 """
 
 import os
+from array import array
+from functools import cache
+from types import MappingProxyType
+
 from dotenv import load_dotenv
 
+
+@cache
+def _load_env() -> bool:
+    """
+    Load the .env file once per process.
+    
+    Repeated imports and app factory calls (tests, reloader) reuse the
+    first result instead of re-parsing the file.
+    
+    Returns:
+        True if a .env file was found and loaded
+    """
+    return load_dotenv()
+
+
 # Load .env file if present
-load_dotenv()
+_load_env()
 
 
 class Config:
@@ -27,11 +46,17 @@ class Config:
     DEBUG = os.getenv('FLASK_DEBUG', 'true').lower() == 'true'
     HOST = os.getenv('HOST', '0.0.0.0')
     PORT = int(os.getenv('PORT', 5000))
+    # Browser cache lifetime (seconds) for CSS/JS served via send_from_directory.
+    # Their file names aren't content-hashed, so keep this short; audio sets
+    # its own long lifetime.
+    SEND_FILE_MAX_AGE_DEFAULT = int(os.getenv('SEND_FILE_MAX_AGE_DEFAULT', 3600))
     
     # ==========================================================================
     # Access Control
     # ==========================================================================
     REQUIRE_AUTH = os.getenv('REQUIRE_AUTH', 'true').lower() == 'true'
+    TOKENS_DB = os.getenv('TOKENS_DB', './data/tokens.db')
+    # Legacy JSON token store, imported into TOKENS_DB on first use
     TOKENS_FILE = os.getenv('TOKENS_FILE', './data/tokens.json')
     
     # ==========================================================================
@@ -51,8 +76,8 @@ class Config:
     # ==========================================================================
     TTS_LANGUAGE_CODE = os.getenv('TTS_LANGUAGE_CODE', 'en-US')
     
-    # Voice Presets: 3 tiers × 2 genders
-    VOICE_PRESETS = {
+    # Voice Presets: 3 tiers × 2 genders (read-only)
+    VOICE_PRESETS = MappingProxyType({
         # Budget tier - WaveNet ($4/million chars)
         "budget_female": {
             "name": "en-US-Wavenet-F",
@@ -112,7 +137,7 @@ class Config:
             "hourly_estimate": "$1.00/hour",
             "supports_rate": False
         }
-    }
+    })
     
     DEFAULT_VOICE = os.getenv('DEFAULT_VOICE', 'premium_female')
     DEFAULT_SPEECH_RATE = float(os.getenv('DEFAULT_SPEECH_RATE', 0.95))  # Range: 0.5 to 1.5
@@ -120,15 +145,11 @@ class Config:
     # ==========================================================================
     # Paths
     # ==========================================================================
-    # In Docker, app is at /app, data is at /app/data
     # Locally, we need to go up from app/ to the project root
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
-    # Check if we're in Docker (data dir at /app/data) or local
-    if os.path.exists('/app/data'):
-        DATA_DIR = '/app/data'
-    else:
-        DATA_DIR = os.path.join(BASE_DIR, 'data')
+    # The Docker image sets MARS_DATA_DIR=/app/data; locally use project data/
+    DATA_DIR = os.getenv('MARS_DATA_DIR') or os.path.join(BASE_DIR, 'data')
     
     DATABASE_PATH = os.getenv('DATABASE_PATH', os.path.join(DATA_DIR, 'interviews.db'))
     AUDIO_CACHE_DIR = os.getenv('AUDIO_CACHE_DIR', os.path.join(DATA_DIR, 'audio_cache'))
@@ -152,9 +173,75 @@ class Config:
         
         return errors
     
+    @classmethod
+    def cost_for(cls, voice_preset: str, char_count: int) -> float:
+        """
+        Calculate TTS cost for a number of characters with a voice preset.
+        
+        Args:
+            voice_preset: Voice preset key from VOICE_PRESETS
+            char_count: Number of characters synthesized
+        
+        Returns:
+            Estimated cost in USD
+        """
+        return char_count * _COST_PER_CHAR[_PRESET_IDS[voice_preset]]
+    
+    @classmethod
+    def voices_for_tier(cls, tier: str) -> tuple:
+        """
+        Get the voice preset keys in a tier.
+        
+        Args:
+            tier: 'budget', 'standard', or 'premium'
+        
+        Returns:
+            Tuple of voice preset keys (empty for unknown tiers)
+        """
+        return _VOICES_BY_TIER.get(tier, ())
+    
     @classmethod
     def ensure_directories(cls):
-        """Create required directories if they don't exist."""
-        os.makedirs(cls.DATA_DIR, exist_ok=True)
-        os.makedirs(cls.AUDIO_CACHE_DIR, exist_ok=True)
-        os.makedirs(cls.EXPORTS_DIR, exist_ok=True)
+        """
+        Create required directories if they don't exist.
+        
+        Nested directories are created first so DATA_DIR is usually
+        covered as their parent, and directories already ensured in this
+        process are skipped on repeated app factory calls.
+        """
+        for path in (cls.AUDIO_CACHE_DIR, cls.EXPORTS_DIR, cls.DATA_DIR):
+            _ensure_dir(path)
+
+
+# Directories created (or found) by ensure_directories in this process
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(path: str):
+    """Create a directory once per process, remembering its parents too."""
+    if path in _ENSURED_DIRS:
+        return
+    
+    os.makedirs(path, exist_ok=True)
+    
+    # makedirs created every parent as well
+    while path and path not in _ENSURED_DIRS:
+        _ENSURED_DIRS.add(path)
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+
+
+# =============================================================================
+# Voice preset lookup tables (built once at import)
+# =============================================================================
+_VOICES_BY_TIER = MappingProxyType({
+    tier: tuple(key for key, preset in Config.VOICE_PRESETS.items() if preset["tier"] == tier)
+    for tier in ("budget", "standard", "premium")
+})
+
+# Integer preset ids index a flat array of per-character costs
+_PRESET_IDS = MappingProxyType({key: i for i, key in enumerate(Config.VOICE_PRESETS)})
+
+_COST_PER_CHAR = array('d', [preset["cost_per_char"] for preset in Config.VOICE_PRESETS.values()])
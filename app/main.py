@@ -3,15 +3,13 @@ Flask application factory and entry point for SME Interview System.
 """
 
 import os
+import threading
 from flask import Flask
 from flask_cors import CORS
 
 from app.config import Config
-from app.models.database import init_db, close_db
-from app.routes.auth import bp as auth_bp
-from app.routes.interview import interview_bp
-from app.routes.sessions import sessions_bp
-from app.routes.static import static_bp
+from app.models.database import init_db, teardown_db
+from app.serialization import OrjsonProvider
 
 
 def create_app(config_class=Config):
@@ -29,6 +27,9 @@ def create_app(config_class=Config):
                 template_folder='../templates',
                 static_folder='../static')
     
+    # Encode jsonify() responses with orjson when it's installed
+    app.json = OrjsonProvider(app)
+    
     # Load configuration
     app.config.from_object(config_class)
     app.secret_key = config_class.SECRET_KEY
@@ -44,6 +45,13 @@ def create_app(config_class=Config):
         init_db()
     
     # Register blueprints
+    # Imported here so importing app.main doesn't pull in the Anthropic
+    # and Google TTS SDKs until an app is actually created.
+    from app.routes.auth import bp as auth_bp
+    from app.routes.interview import interview_bp
+    from app.routes.sessions import sessions_bp
+    from app.routes.static import static_bp
+    
     # Auth blueprint handles /, /auth, /interview, /api/auth, /api/logout
     app.register_blueprint(auth_bp)
     app.register_blueprint(interview_bp)
@@ -51,10 +59,15 @@ def create_app(config_class=Config):
     app.register_blueprint(static_bp)
     
     # Register teardown
-    @app.teardown_appcontext
-    def teardown_db(exception):
-        """Close database connection on app context teardown."""
-        pass  # Connection is managed globally for simplicity
+    # Connections are cached per worker thread; teardown only finishes
+    # any transaction the request left open.
+    app.teardown_appcontext(teardown_db)
+    
+    # Connect to Google TTS in the background so the first greeting
+    # doesn't pay for the channel handshake
+    if not app.testing and config_class.FLASK_ENV != 'testing':
+        from app.services.tts_client import warm_up
+        threading.Thread(target=warm_up, name="tts-warmup", daemon=True).start()
     
     # Log startup info
     if app.debug:
@@ -4,30 +4,126 @@ Database setup and connection management for SQLite.
 
 import sqlite3
 import os
+import sys
+import threading
+from contextlib import contextmanager
 from app.config import Config
 
 
 # Thread-local storage for database connections
-_db_connection = None
+_tls = threading.local()
+
+# Connection tuning applied to every new connection:
+# - WAL lets readers proceed while a writer is active
+# - synchronous=NORMAL is durable under WAL without an fsync per commit
+# - mmap/temp_store/cache_size keep hot pages out of read() syscalls
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA mmap_size=268435456;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+"""
+
+# Column migrations for databases created before a column existed:
+# (schema version, column, statement). PRAGMA user_version records the
+# last version applied, so up-to-date databases skip the schema work.
+_MIGRATIONS = [
+    (1, "voice_preset", "ALTER TABLE sessions ADD COLUMN voice_preset TEXT DEFAULT 'premium_female'"),
+    (2, "speech_rate", "ALTER TABLE sessions ADD COLUMN speech_rate REAL DEFAULT 0.95"),
+    (3, "total_chars_synthesized", "ALTER TABLE sessions ADD COLUMN total_chars_synthesized INTEGER DEFAULT 0"),
+    (4, "estimated_cost", "ALTER TABLE sessions ADD COLUMN estimated_cost REAL DEFAULT 0.0"),
+    (5, "token_user_name", "ALTER TABLE sessions ADD COLUMN token_user_name TEXT"),
+    (6, "token_user_callsign", "ALTER TABLE sessions ADD COLUMN token_user_callsign TEXT"),
+    (7, "last_extracted_message_id", "ALTER TABLE sessions ADD COLUMN last_extracted_message_id INTEGER DEFAULT 0"),
+]
+
+_SCHEMA_VERSION = _MIGRATIONS[-1][0]
+
+
+def column_names(cursor: sqlite3.Cursor) -> tuple:
+    """
+    Get the interned column names of a cursor's result set.
+    
+    Building rows with dict(zip(column_names(cursor), row)) reuses one
+    key object per column across every row instead of going through
+    sqlite3.Row.keys() for each row.
+    
+    Args:
+        cursor: Cursor that has executed a SELECT
+    
+    Returns:
+        Tuple of column names
+    """
+    return tuple(sys.intern(column[0]) for column in cursor.description)
 
 
 def get_db() -> sqlite3.Connection:
     """
-    Get a database connection.
+    Get the database connection for the current thread.
+    
+    Each worker thread opens its own connection on first use and reuses
+    it for later requests, so concurrent requests don't serialize on a
+    single shared connection.
     
     Returns:
         SQLite database connection
     """
-    global _db_connection
+    conn = getattr(_tls, "conn", None)
     
-    if _db_connection is None:
-        _db_connection = sqlite3.connect(
-            Config.DATABASE_PATH,
-            check_same_thread=False
-        )
-        _db_connection.row_factory = sqlite3.Row
+    if conn is None:
+        # Autocommit mode: single statements commit on their own and
+        # multi-statement writes group themselves with transaction().
+        # The larger statement cache keeps every model query prepared.
+        conn = sqlite3.connect(Config.DATABASE_PATH, isolation_level=None,
+                               cached_statements=512)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_CONNECTION_PRAGMAS)
+        _tls.conn = conn
     
-    return _db_connection
+    return conn
+
+
+@contextmanager
+def transaction(db: sqlite3.Connection):
+    """
+    Group several statements into one explicit transaction.
+    
+    Commits when the block exits normally and rolls back if it raises.
+    
+    Args:
+        db: Database connection from get_db()
+    
+    Yields:
+        The same connection
+    """
+    db.execute("BEGIN")
+    try:
+        yield db
+    except BaseException:
+        db.rollback()
+        raise
+    db.commit()
+
+
+def teardown_db(exception=None):
+    """
+    Finish the current thread's connection at app context teardown.
+    
+    Any transaction left open by the request is committed (or rolled
+    back if the request failed) so it doesn't hold the write lock. The
+    connection itself stays open for reuse by the same thread.
+    
+    Args:
+        exception: Exception that ended the request, if any
+    """
+    conn = getattr(_tls, "conn", None)
+    
+    if conn is not None and conn.in_transaction:
+        if exception is None:
+            conn.commit()
+        else:
+            conn.rollback()
 
 
 def init_db():
@@ -43,6 +139,20 @@ def init_db():
     db = get_db()
     cursor = db.cursor()
     
+    # Already at the current schema version - nothing to do
+    cursor.execute("PRAGMA user_version")
+    if cursor.fetchone()[0] >= _SCHEMA_VERSION:
+        return
+    
+    with transaction(db):
+        _create_schema(cursor)
+        
+        # Run migrations for existing databases
+        _run_migrations(cursor)
+
+
+def _create_schema(cursor):
+    """Create tables and indexes that don't exist yet."""
     # Create sessions table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS sessions (
@@ -62,7 +172,8 @@ def init_db():
             total_chars_synthesized INTEGER DEFAULT 0,
             estimated_cost REAL DEFAULT 0.0,
             token_user_name TEXT,
-            token_user_callsign TEXT
+            token_user_callsign TEXT,
+            last_extracted_message_id INTEGER DEFAULT 0
         )
     """)
     
@@ -93,70 +204,55 @@ def init_db():
     """)
     
     # Create indexes
+    # (session_id, created_at) lets per-session queries return rows in
+    # time order straight from the index, without a separate sort step.
+    # They replace the older single-column session_id indexes.
+    cursor.execute("DROP INDEX IF EXISTS idx_messages_session")
+    cursor.execute("DROP INDEX IF EXISTS idx_extractions_session")
+    
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_messages_session 
-        ON messages(session_id)
+        CREATE INDEX IF NOT EXISTS idx_messages_session_time 
+        ON messages(session_id, created_at)
     """)
     
     cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_extractions_session 
-        ON extractions(session_id)
+        CREATE INDEX IF NOT EXISTS idx_extractions_session_time 
+        ON extractions(session_id, created_at)
     """)
-    
-    db.commit()
-    
-    # Run migrations for existing databases
-    _run_migrations(db)
 
 
-def _run_migrations(db):
+def _run_migrations(cursor):
     """
     Run database migrations to add new columns to existing tables.
-    Safe to run multiple times - checks each column individually.
+    Applies only migrations newer than the stored user_version; each
+    column is still checked individually because databases created
+    before versioning may have any subset of them.
     """
-    cursor = db.cursor()
+    cursor.execute("PRAGMA user_version")
+    version = cursor.fetchone()[0]
     
     # Get existing column names
     cursor.execute("PRAGMA table_info(sessions)")
     existing_columns = {row[1] for row in cursor.fetchall()}
     
-    # Add voice_preset if missing
-    if 'voice_preset' not in existing_columns:
-        cursor.execute("ALTER TABLE sessions ADD COLUMN voice_preset TEXT DEFAULT 'premium_female'")
-    
-    # Add speech_rate if missing
-    if 'speech_rate' not in existing_columns:
-        cursor.execute("ALTER TABLE sessions ADD COLUMN speech_rate REAL DEFAULT 0.95")
-    
-    # Add total_chars_synthesized if missing
-    if 'total_chars_synthesized' not in existing_columns:
-        cursor.execute("ALTER TABLE sessions ADD COLUMN total_chars_synthesized INTEGER DEFAULT 0")
-    
-    # Add estimated_cost if missing
-    if 'estimated_cost' not in existing_columns:
-        cursor.execute("ALTER TABLE sessions ADD COLUMN estimated_cost REAL DEFAULT 0.0")
-    
-    # Add token_user_name if missing
-    if 'token_user_name' not in existing_columns:
-        cursor.execute("ALTER TABLE sessions ADD COLUMN token_user_name TEXT")
-    
-    # Add token_user_callsign if missing
-    if 'token_user_callsign' not in existing_columns:
-        cursor.execute("ALTER TABLE sessions ADD COLUMN token_user_callsign TEXT")
-    
-    db.commit()
+    # Add any missing columns
+    for migration_version, column, statement in _MIGRATIONS:
+        if migration_version > version and column not in existing_columns:
+            cursor.execute(statement)
     
     # Migrate old voice_quality column to voice_preset if it exists
     if 'voice_quality' in existing_columns:
         cursor.execute("UPDATE sessions SET voice_preset = 'standard_male' WHERE voice_quality = 'standard' AND voice_preset IS NULL")
         cursor.execute("UPDATE sessions SET voice_preset = 'premium_female' WHERE voice_quality = 'natural' AND voice_preset IS NULL")
-        db.commit()
+    
+    # Record the schema version (PRAGMA doesn't accept bound parameters)
+    cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION:d}")
 
 
 def close_db():
-    """Close the database connection."""
-    global _db_connection
+    """Close the current thread's database connection."""
+    conn = getattr(_tls, "conn", None)
     
-    if _db_connection is not None:
-        _db_connection.close()
-        _db_connection = None
+    if conn is not None:
+        conn.close()
+        _tls.conn = None
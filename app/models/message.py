@@ -2,7 +2,17 @@
 Message model for interview conversation messages.
 """
 
-from typing import List, Optional
+import sys
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from app.models.database import column_names, transaction
+
+
+# Shared role strings so Claude payloads reuse one object per role
+_ROLE_INTERN = {
+    "user": sys.intern("user"),
+    "assistant": sys.intern("assistant"),
+}
 
 
 class Message:
@@ -29,11 +39,38 @@ class Message:
         cursor.execute("""
             INSERT INTO messages (session_id, role, content, audio_path)
             VALUES (?, ?, ?, ?)
+            RETURNING *
         """, (session_id, role, content, audio_path))
+        row = cursor.fetchone()
         
         db.commit()
         
-        return Message.get_by_id(db, cursor.lastrowid)
+        return dict(row)
+    
+    @staticmethod
+    def create_many(db, session_id: str,
+                    rows: Iterable[Tuple[str, str, Optional[str]]]) -> int:
+        """
+        Create several messages in a single transaction.
+        
+        Args:
+            db: Database connection
+            session_id: The session these messages belong to
+            rows: Iterable of (role, content, audio_path) tuples
+        
+        Returns:
+            Number of messages created
+        """
+        cursor = db.cursor()
+        
+        with transaction(db):
+            cursor.executemany("""
+                INSERT INTO messages (session_id, role, content, audio_path)
+                VALUES (?, ?, ?, ?)
+            """, [(session_id, role, content, audio_path)
+                  for role, content, audio_path in rows])
+        
+        return cursor.rowcount
     
     @staticmethod
     def get_by_id(db, message_id: int) -> Optional[dict]:
@@ -54,25 +91,50 @@ class Message:
         return dict(row) if row else None
     
     @staticmethod
-    def get_by_session(db, session_id: str) -> List[dict]:
+    def iter_by_session(db, session_id: str, batch_size: int = 200) -> Iterator[dict]:
         """
-        Get all messages for a session.
+        Stream all messages for a session.
+        
+        Rows are fetched in batches so long interviews never hold the
+        full result set and its dict copies in memory at the same time.
         
         Args:
             db: Database connection
             session_id: The session ID
+            batch_size: Rows fetched from SQLite per round trip
         
-        Returns:
-            List of message dicts, ordered by creation time
+        Yields:
+            Message dicts, ordered by creation time
         """
         cursor = db.cursor()
+        cursor.arraysize = batch_size
         cursor.execute("""
             SELECT * FROM messages 
             WHERE session_id = ? 
             ORDER BY created_at ASC
         """, (session_id,))
         
-        return [dict(row) for row in cursor.fetchall()]
+        columns = column_names(cursor)
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
+    
+    @staticmethod
+    def get_by_session(db, session_id: str) -> List[dict]:
+        """
+        Get all messages for a session.
+        
+        Args:
+            db: Database connection
+            session_id: The session ID
+        
+        Returns:
+            List of message dicts, ordered by creation time
+        """
+        return list(Message.iter_by_session(db, session_id))
     
     @staticmethod
     def get_recent(db, session_id: str, limit: int = 30) -> List[dict]:
@@ -85,18 +147,118 @@ class Message:
             limit: Maximum number of messages to return
         
         Returns:
-            List of recent message dicts
+            List of recent message dicts, oldest first
         """
         cursor = db.cursor()
+        # Take the newest N from the index, then return them oldest first.
+        # created_at only has one-second resolution, so break ties on the
+        # AUTOINCREMENT id.
         cursor.execute("""
-            SELECT * FROM messages 
-            WHERE session_id = ? 
-            ORDER BY created_at DESC
-            LIMIT ?
+            SELECT * FROM (
+                SELECT * FROM messages 
+                WHERE session_id = ? 
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+            )
+            ORDER BY created_at ASC, id ASC
+        """, (session_id, limit))
+        
+        columns = column_names(cursor)
+        return [dict(zip(columns, row)) for row in cursor]
+    
+    @staticmethod
+    def get_roles_contents(db, session_id: str, limit: int = 30) -> List[dict]:
+        """
+        Get recent messages for a session in Claude API format.
+        
+        Selects only role and content, so callers building Claude
+        requests skip the full-row dict per message.
+        
+        Args:
+            db: Database connection
+            session_id: The session ID
+            limit: Maximum number of messages to return
+        
+        Returns:
+            List of {"role", "content"} dicts, oldest first
+        """
+        cursor = db.cursor()
+        cursor.execute("""
+            SELECT role, content FROM (
+                SELECT id, created_at, role, content FROM messages 
+                WHERE session_id = ? 
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+            )
+            ORDER BY created_at ASC, id ASC
+        """, (session_id, limit))
+        
+        return [
+            {"role": _ROLE_INTERN.get(role, role), "content": content}
+            for role, content in cursor
+        ]
+    
+    @staticmethod
+    def get_window(db, session_id: str, limit: int = 30) -> Tuple[List[dict], int]:
+        """
+        Get recent messages in Claude API format plus the session's total.
+        
+        One query: the window function counts every message in the session
+        before LIMIT trims the rows, replacing a separate COUNT(*) call.
+        
+        Args:
+            db: Database connection
+            session_id: The session ID
+            limit: Maximum number of messages to return
+        
+        Returns:
+            Tuple of ({"role", "content"} dicts oldest first, total message count)
+        """
+        cursor = db.cursor()
+        cursor.execute("""
+            SELECT role, content, total FROM (
+                SELECT id, created_at, role, content, COUNT(*) OVER () AS total
+                FROM messages 
+                WHERE session_id = ? 
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+            )
+            ORDER BY created_at ASC, id ASC
         """, (session_id, limit))
         
-        # Reverse to get chronological order
-        return [dict(row) for row in reversed(cursor.fetchall())]
+        total = 0
+        messages = []
+        for role, content, total in cursor:
+            messages.append({"role": _ROLE_INTERN.get(role, role), "content": content})
+        return messages, total
+    
+    @staticmethod
+    def get_since(db, session_id: str, after_id: int, limit: int = 30) -> List[dict]:
+        """
+        Get a session's messages added after a given message ID.
+        
+        Args:
+            db: Database connection
+            session_id: The session ID
+            after_id: Only messages with a greater ID are returned
+            limit: Maximum number of messages to return; the oldest ones
+                come first, so callers can page on from the last ID
+        
+        Returns:
+            List of {"id", "role", "content"} dicts, oldest first
+        """
+        cursor = db.cursor()
+        cursor.execute("""
+            SELECT id, role, content FROM messages 
+            WHERE session_id = ? AND id > ?
+            ORDER BY id
+            LIMIT ?
+        """, (session_id, after_id, limit))
+        
+        return [
+            {"id": message_id, "role": _ROLE_INTERN.get(role, role), "content": content}
+            for message_id, role, content in cursor
+        ]
     
     @staticmethod
     def count_by_session(db, session_id: str) -> int:
@@ -117,6 +279,27 @@ class Message:
         )
         return cursor.fetchone()[0]
     
+    @staticmethod
+    def get_session_stats(db, session_id: str) -> Tuple[Optional[str], Optional[str], int]:
+        """
+        Get the first and last message timestamps and message count.
+        
+        Args:
+            db: Database connection
+            session_id: The session ID
+        
+        Returns:
+            Tuple of (first created_at, last created_at, count); the
+            timestamps are None when the session has no messages
+        """
+        cursor = db.cursor()
+        cursor.execute(
+            "SELECT MIN(created_at), MAX(created_at), COUNT(*) FROM messages WHERE session_id = ?",
+            (session_id,)
+        )
+        first_at, last_at, count = cursor.fetchone()
+        return first_at, last_at, count
+    
     @staticmethod
     def delete_by_session(db, session_id: str) -> int:
         """
@@ -146,6 +329,6 @@ class Message:
             List of dicts with 'role' and 'content' keys only
         """
         return [
-            {"role": m["role"], "content": m["content"]}
+            {"role": _ROLE_INTERN.get(m["role"], m["role"]), "content": m["content"]}
             for m in messages
         ]
@@ -2,9 +2,90 @@
 Session model for interview sessions.
 """
 
-import json
-from datetime import datetime
-from typing import Optional, List
+import atexit
+import sqlite3
+import threading
+from functools import lru_cache
+from typing import Optional, List, Tuple
+
+from app.models.database import column_names, get_db, transaction
+from app.serialization import dumps, loads
+
+
+# TTS cost increments not yet written, keyed by session id: (chars, cost).
+# The counters are written once a session has accumulated
+# _COST_FLUSH_CHARS characters, when it ends, or at process exit, instead
+# of committing once per synthesized chunk.
+_COST_FLUSH_CHARS = 2000
+_pending_cost = {}
+_pending_lock = threading.Lock()
+
+
+def _decode_json(text: str):
+    """
+    Decode a JSON column value into a new object.
+    
+    Not memoized: a cached value would be shared by every caller, so an
+    in-place edit would corrupt later reads of the row, and copying it out
+    costs more than orjson re-parsing the text.
+    """
+    return loads(text)
+
+
+def _row_to_session(row, columns: Optional[tuple] = None) -> Optional[dict]:
+    """
+    Convert a sessions row to a dict, decoding its JSON fields.
+    
+    Args:
+        row: sqlite3.Row from the sessions table, or None
+        columns: Column names from column_names(), when converting many rows
+    
+    Returns:
+        Session dict or None
+    """
+    if row is None:
+        return None
+    
+    session = dict(zip(columns, row)) if columns else dict(row)
+    
+    # Include cost increments that haven't been written yet
+    pending = _pending_cost.get(session["id"])
+    if pending:
+        session["total_chars_synthesized"] = (session.get("total_chars_synthesized") or 0) + pending[0]
+        session["estimated_cost"] = (session.get("estimated_cost") or 0.0) + pending[1]
+    
+    # Parse JSON fields
+    if session.get("topics"):
+        session["topics"] = _decode_json(session["topics"])
+    if session.get("extracted_knowledge"):
+        session["extracted_knowledge"] = _decode_json(session["extracted_knowledge"])
+    
+    return session
+
+
+@lru_cache(maxsize=64)
+def _update_statement(columns: frozenset) -> Tuple[Tuple[str, ...], str]:
+    """
+    Build the UPDATE statement for a set of session columns.
+    
+    Args:
+        columns: Column names being updated
+    
+    Returns:
+        Tuple of (columns in bind order, SQL text)
+    """
+    ordered = tuple(sorted(columns))
+    # SQLite stamps updated_at itself
+    set_clauses = [f"{column} = ?" for column in ordered]
+    set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+    
+    sql = f"""
+            UPDATE sessions 
+            SET {', '.join(set_clauses)}
+            WHERE id = ?
+            RETURNING *
+        """
+    return ordered, sql
 
 
 class Session:
@@ -34,19 +115,25 @@ class Session:
         """
         cursor = db.cursor()
         
-        topics_json = json.dumps(topics) if topics else None
+        topics_json = dumps(topics) if topics else None
+        
+        # A new row starts at zero cost
+        with _pending_lock:
+            _pending_cost.pop(session_id, None)
         
         cursor.execute("""
             INSERT INTO sessions (id, expert_name, expert_callsign, topics, voice_preset,
                                   speech_rate, total_chars_synthesized, estimated_cost,
                                   token_user_name, token_user_callsign)
             VALUES (?, ?, ?, ?, ?, ?, 0, 0.0, ?, ?)
+            RETURNING *
         """, (session_id, expert_name, expert_callsign, topics_json, voice_preset, speech_rate,
               token_user_name, token_user_callsign))
+        row = cursor.fetchone()
         
         db.commit()
         
-        return Session.get_by_id(db, session_id)
+        return _row_to_session(row)
     
     @staticmethod
     def get_by_id(db, session_id: str) -> Optional[dict]:
@@ -62,20 +149,8 @@ class Session:
         """
         cursor = db.cursor()
         cursor.execute("SELECT * FROM sessions WHERE id = ?", (session_id,))
-        row = cursor.fetchone()
-        
-        if row is None:
-            return None
-        
-        session = dict(row)
         
-        # Parse JSON fields
-        if session.get("topics"):
-            session["topics"] = json.loads(session["topics"])
-        if session.get("extracted_knowledge"):
-            session["extracted_knowledge"] = json.loads(session["extracted_knowledge"])
-        
-        return session
+        return _row_to_session(cursor.fetchone())
     
     @staticmethod
     def get_all(db, status: Optional[str] = None) -> List[dict]:
@@ -99,18 +174,40 @@ class Session:
         else:
             cursor.execute("SELECT * FROM sessions ORDER BY created_at DESC")
         
-        rows = cursor.fetchall()
-        sessions = []
+        columns = column_names(cursor)
+        return [_row_to_session(row, columns) for row in cursor]
+    
+    @staticmethod
+    def get_all_summary(db, status: Optional[str] = None) -> List[dict]:
+        """
+        Get the listing fields of all sessions, optionally filtered by status.
         
-        for row in rows:
-            session = dict(row)
-            if session.get("topics"):
-                session["topics"] = json.loads(session["topics"])
-            if session.get("extracted_knowledge"):
-                session["extracted_knowledge"] = json.loads(session["extracted_knowledge"])
-            sessions.append(session)
+        Only the columns shown in session lists are read, so topics and
+        extracted knowledge are neither loaded nor decoded.
         
-        return sessions
+        Args:
+            db: Database connection
+            status: Optional status filter ('active', 'completed', 'abandoned')
+        
+        Returns:
+            List of dicts with id, expert_name, expert_callsign, status,
+            message_count and created_at
+        """
+        cursor = db.cursor()
+        
+        if status:
+            cursor.execute("""
+                SELECT id, expert_name, expert_callsign, status, message_count, created_at
+                FROM sessions WHERE status = ? ORDER BY created_at DESC
+            """, (status,))
+        else:
+            cursor.execute("""
+                SELECT id, expert_name, expert_callsign, status, message_count, created_at
+                FROM sessions ORDER BY created_at DESC
+            """)
+        
+        columns = column_names(cursor)
+        return [dict(zip(columns, row)) for row in cursor]
     
     @staticmethod
     def update(db, session_id: str, **kwargs) -> dict:
@@ -129,26 +226,22 @@ class Session:
         
         # Handle JSON fields
         if "topics" in kwargs and isinstance(kwargs["topics"], list):
-            kwargs["topics"] = json.dumps(kwargs["topics"])
+            kwargs["topics"] = dumps(kwargs["topics"])
         if "extracted_knowledge" in kwargs and isinstance(kwargs["extracted_knowledge"], dict):
-            kwargs["extracted_knowledge"] = json.dumps(kwargs["extracted_knowledge"])
-        
-        # Add updated_at
-        kwargs["updated_at"] = datetime.utcnow().isoformat()
+            kwargs["extracted_knowledge"] = dumps(kwargs["extracted_knowledge"])
         
-        # Build update query
-        set_clauses = [f"{key} = ?" for key in kwargs.keys()]
-        values = list(kwargs.values()) + [session_id]
+        # Same column set -> same SQL text, so sqlite3's statement cache
+        # reuses the prepared statement
+        columns, sql = _update_statement(frozenset(kwargs))
+        values = [kwargs[column] for column in columns]
+        values.append(session_id)
         
-        cursor.execute(f"""
-            UPDATE sessions 
-            SET {', '.join(set_clauses)}
-            WHERE id = ?
-        """, values)
+        cursor.execute(sql, values)
+        row = cursor.fetchone()
         
         db.commit()
         
-        return Session.get_by_id(db, session_id)
+        return _row_to_session(row)
     
     @staticmethod
     def delete(db, session_id: str) -> bool:
@@ -164,39 +257,120 @@ class Session:
         """
         cursor = db.cursor()
         
-        # Delete messages first (foreign key)
-        cursor.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
-        cursor.execute("DELETE FROM extractions WHERE session_id = ?", (session_id,))
-        cursor.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+        with _pending_lock:
+            _pending_cost.pop(session_id, None)
         
-        db.commit()
+        # One transaction for all three deletes (rolled back on error)
+        with transaction(db):
+            # Delete messages first (foreign key)
+            cursor.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            cursor.execute("DELETE FROM extractions WHERE session_id = ?", (session_id,))
+            cursor.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
         
         return cursor.rowcount > 0
     
     @staticmethod
-    def update_cost(db, session_id: str, chars_synthesized: int, cost: float) -> dict:
+    def update_cost(db, session_id: str, chars_synthesized: int, cost: float,
+                    current: Optional[dict] = None) -> dict:
         """
         Increment the TTS cost tracking for a session.
         
+        Increments are held in memory until the session has accumulated
+        _COST_FLUSH_CHARS characters; the returned totals always include
+        them.
+        
         Args:
             db: Database connection
             session_id: The session ID
             chars_synthesized: Number of characters just synthesized
             cost: Cost for these characters
+            current: The caller's up-to-date session dict, if it has one;
+                when nothing is written the new totals are applied to it
+                instead of re-reading the row
         
         Returns:
             Updated session dict with new totals
         """
-        cursor = db.cursor()
+        with _pending_lock:
+            pending_chars, pending_cost = _pending_cost.pop(session_id, (0, 0.0))
+            pending_chars += chars_synthesized
+            pending_cost += cost
+            
+            if pending_chars < _COST_FLUSH_CHARS:
+                _pending_cost[session_id] = (pending_chars, pending_cost)
+                pending_chars = 0
+        
+        if not pending_chars:
+            if current is not None:
+                return {
+                    **current,
+                    "total_chars_synthesized": (current.get("total_chars_synthesized") or 0) + chars_synthesized,
+                    "estimated_cost": (current.get("estimated_cost") or 0.0) + cost,
+                }
+            return Session.get_by_id(db, session_id)
+        
+        return _write_cost(db, session_id, pending_chars, pending_cost)
+    
+    @staticmethod
+    def finalize(db, session_id: str) -> Optional[dict]:
+        """
+        Write any buffered cost increments for a session.
         
-        cursor.execute("""
-            UPDATE sessions 
-            SET total_chars_synthesized = total_chars_synthesized + ?,
-                estimated_cost = estimated_cost + ?,
-                updated_at = ?
-            WHERE id = ?
-        """, (chars_synthesized, cost, datetime.utcnow().isoformat(), session_id))
+        Args:
+            db: Database connection
+            session_id: The session ID
         
-        db.commit()
+        Returns:
+            Session dict with final totals, or None if not found
+        """
+        with _pending_lock:
+            pending = _pending_cost.pop(session_id, None)
+        
+        if pending:
+            return _write_cost(db, session_id, *pending)
         
         return Session.get_by_id(db, session_id)
+
+
+def _write_cost(db, session_id: str, chars_synthesized: int, cost: float) -> Optional[dict]:
+    """Add cost increments to a session row and return the updated session."""
+    cursor = db.cursor()
+    
+    cursor.execute("""
+        UPDATE sessions 
+        SET total_chars_synthesized = total_chars_synthesized + ?,
+            estimated_cost = estimated_cost + ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+        RETURNING *
+    """, (chars_synthesized, cost, session_id))
+    row = cursor.fetchone()
+    
+    db.commit()
+    
+    return _row_to_session(row)
+
+
+@atexit.register
+def _flush_pending_costs():
+    """Write all buffered cost increments before the process exits."""
+    with _pending_lock:
+        pending = list(_pending_cost.items())
+        _pending_cost.clear()
+    
+    if not pending:
+        return
+    
+    try:
+        db = get_db()
+        with transaction(db):
+            db.executemany("""
+                UPDATE sessions 
+                SET total_chars_synthesized = total_chars_synthesized + ?,
+                    estimated_cost = estimated_cost + ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, [(chars, cost, session_id) for session_id, (chars, cost) in pending])
+    except sqlite3.Error:
+        # Nothing more can be done for the counters at interpreter exit
+        pass
@@ -54,5 +54,51 @@ Topics mentioned but not fully explored that the interviewer should revisit.
 - Flag any sensitive information that should not be published
 
 ## OUTPUT FORMAT
-Respond with a valid JSON object only. No additional text or explanation.
+Record the extraction with the record_extraction tool. No additional text or explanation.
 """
+
+
+def _string_array(description: str) -> dict:
+    return {"type": "array", "items": {"type": "string"}, "description": description}
+
+
+def _object_array(properties: list, description: str) -> dict:
+    return {
+        "type": "array",
+        "description": description,
+        "items": {
+            "type": "object",
+            "properties": {name: {"type": "string"} for name in properties},
+        },
+    }
+
+
+# Tool the extractor is forced to call, so Claude returns the extraction
+# as structured input instead of JSON embedded in text
+EXTRACTION_TOOL = {
+    "name": "record_extraction",
+    "description": "Record the knowledge extracted from an interview segment.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "topics_discussed": _string_array("Specific topics covered in this segment"),
+            "key_insights": _object_array(
+                ["topic", "insight", "source_quote", "importance"],
+                "Most valuable information; importance is high, medium or low"
+            ),
+            "people_mentioned": _object_array(
+                ["name", "callsign", "context"], "People referenced and their role"
+            ),
+            "technical_details": _object_array(
+                ["system", "detail", "rationale"], "Specific implementation details"
+            ),
+            "lessons_learned": _string_array("Advice and lessons shared by the expert"),
+            "open_questions": _string_array("Things still unclear that need follow-up"),
+            "follow_up_topics": _string_array("Topics mentioned but not fully explored"),
+        },
+        "required": [
+            "topics_discussed", "key_insights", "people_mentioned", "technical_details",
+            "lessons_learned", "open_questions", "follow_up_topics",
+        ],
+    },
+}
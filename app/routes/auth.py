@@ -2,23 +2,58 @@
 
 from flask import Blueprint, request, jsonify, session, redirect, url_for, render_template
 from functools import wraps
-from app.services.token_manager import validate_token, increment_session_count
+from app.services.token_manager import validate_token, get_user, invalidate_user, token_id
 from app.config import Config
 
 bp = Blueprint('auth', __name__)
 
+# Generated tokens are 22 characters; anything much longer can't be valid
+_MAX_TOKEN_LENGTH = 256
+
+
+def current_user() -> dict | None:
+    """
+    Get the user info for the authenticated session.
+    
+    The session cookie only carries the token's id ('uid'); name and
+    callsign come from the token manager's in-memory cache.
+    
+    Returns:
+        User info dict, or None if not logged in or the token was revoked
+    """
+    user_id = session.get('uid')
+    return get_user(user_id) if user_id else None
+
+
+def check_auth():
+    """
+    Reject the request unless the session is authenticated.
+    
+    Registered as before_request on API blueprints whose routes all
+    require auth, and used by require_auth for individual routes. The
+    session's token is resolved through the token manager, so a revoked
+    or deleted token loses access (within the token cache TTL when it
+    was revoked from another process).
+    
+    Returns:
+        None to continue, or a 401/redirect response
+    """
+    if not Config.REQUIRE_AUTH or current_user():
+        return None
+    
+    session.clear()
+    if request.path.startswith('/api/'):
+        return jsonify({'error': 'Unauthorized'}), 401
+    return redirect(url_for('auth.auth_page'))
+
 
 def require_auth(f):
     """Decorator to require valid session."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not Config.REQUIRE_AUTH:
-            return f(*args, **kwargs)
-        
-        if not session.get('authenticated'):
-            if request.path.startswith('/api/'):
-                return jsonify({'error': 'Unauthorized'}), 401
-            return redirect(url_for('auth.auth_page'))
+        denied = check_auth()
+        if denied is not None:
+            return denied
         
         return f(*args, **kwargs)
     return decorated_function
@@ -27,7 +62,7 @@ def require_auth(f):
 @bp.route('/')
 def index():
     """Root route - redirect based on auth status."""
-    if not Config.REQUIRE_AUTH or session.get('authenticated'):
+    if not Config.REQUIRE_AUTH or current_user():
         return redirect(url_for('auth.interview_page'))
     return redirect(url_for('auth.auth_page'))
 
@@ -35,7 +70,7 @@ def index():
 @bp.route('/auth')
 def auth_page():
     """Token entry page."""
-    if session.get('authenticated'):
+    if current_user():
         return redirect(url_for('auth.interview_page'))
     return render_template('auth.html')
 
@@ -50,16 +85,18 @@ def interview_page():
 @bp.route('/api/auth', methods=['POST'])
 def authenticate():
     """Validate token and create session."""
-    data = request.get_json()
-    token = data.get('token', '').strip()
+    data = request.get_json(silent=True) or {}
+    token = data.get('token')
+    token = token.strip() if isinstance(token, str) else ''
+    
+    # Reject clearly malformed tokens without touching the token store
+    if not 1 <= len(token) <= _MAX_TOKEN_LENGTH:
+        return jsonify({'error': 'Invalid token'}), 401
     
     user_info = validate_token(token)
     
     if user_info:
-        session['authenticated'] = True
-        session['token'] = token
-        session['user_name'] = user_info['name']
-        session['user_callsign'] = user_info.get('callsign')
+        session['uid'] = token_id(token)
         session.permanent = True
         return jsonify({
             'success': True,
@@ -73,6 +110,9 @@ def authenticate():
 @bp.route('/api/logout', methods=['POST'])
 def logout():
     """Clear session and logout."""
+    user_id = session.get('uid')
+    if user_id:
+        invalidate_user(user_id)
     session.clear()
     return jsonify({'success': True})
 
@@ -80,10 +120,11 @@ def logout():
 @bp.route('/api/auth/status')
 def auth_status():
     """Check current auth status."""
-    if session.get('authenticated'):
+    user = current_user()
+    if user:
         return jsonify({
             'authenticated': True,
-            'name': session.get('user_name'),
-            'callsign': session.get('user_callsign')
+            'name': user['name'],
+            'callsign': user.get('callsign')
         })
     return jsonify({'authenticated': False})
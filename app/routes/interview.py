@@ -3,26 +3,43 @@ Interview API routes.
 Handles the main interview interaction endpoint.
 """
 
-from flask import Blueprint, request, jsonify
-from app.services.interview_manager import InterviewManager
-from app.routes.auth import require_auth
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from app.services import get_interview_manager
+from app.routes.auth import check_auth
+from app.serialization import dumps
 
 interview_bp = Blueprint('interview', __name__)
 
-# Global interview manager instance
-_interview_manager = None
+# Every route in this blueprint requires an authenticated session
+interview_bp.before_request(check_auth)
 
 
-def get_interview_manager() -> InterviewManager:
-    """Get or create the interview manager singleton."""
-    global _interview_manager
-    if _interview_manager is None:
-        _interview_manager = InterviewManager()
-    return _interview_manager
+def _read_input():
+    """
+    Read and validate the interview input from the request body.
+    
+    Returns:
+        (session_id, text, None) or (None, None, error response)
+    """
+    data = request.get_json(silent=True)
+    
+    if not data or not isinstance(data, dict):
+        return None, None, (jsonify({"error": "No JSON data provided"}), 400)
+    
+    session_id = data.get("session_id")
+    text = data.get("text")
+    text = text.strip() if isinstance(text, str) else ''
+    
+    if not session_id or not isinstance(session_id, str):
+        return None, None, (jsonify({"error": "session_id is required"}), 400)
+    
+    if not text:
+        return None, None, (jsonify({"error": "text is required"}), 400)
+    
+    return session_id, text, None
 
 
 @interview_bp.route('/api/interview', methods=['POST'])
-@require_auth
 def process_interview_input():
     """
     Process expert's spoken input and get interviewer response.
@@ -42,19 +59,9 @@ def process_interview_input():
             "extraction_triggered": false
         }
     """
-    data = request.get_json()
-    
-    if not data:
-        return jsonify({"error": "No JSON data provided"}), 400
-    
-    session_id = data.get("session_id")
-    text = data.get("text", "").strip()
-    
-    if not session_id:
-        return jsonify({"error": "session_id is required"}), 400
-    
-    if not text:
-        return jsonify({"error": "text is required"}), 400
+    session_id, text, error = _read_input()
+    if error:
+        return error
     
     try:
         manager = get_interview_manager()
@@ -65,8 +72,44 @@ def process_interview_input():
         return jsonify({"error": str(e)}), 500
 
 
+@interview_bp.route('/api/interview/stream', methods=['POST'])
+def stream_interview_input():
+    """
+    Process expert's spoken input, streaming the response as Server-Sent Events.
+    
+    Request body is the same as /api/interview.
+    
+    Events (one JSON object per "data:" line):
+        {"type": "sentence", "text": "First sentence.", "audio_url": "/audio/hash.mp3"}
+        ...
+        {"type": "done", "response_text": "...", "message_count": 5, ...}
+        {"type": "error", "error": "message"}  (instead of "done" on failure)
+    """
+    session_id, text, error = _read_input()
+    if error:
+        return error
+    
+    manager = get_interview_manager()
+    
+    def events():
+        try:
+            for event in manager.stream_input(session_id, text):
+                yield f"data: {dumps(event)}\n\n"
+        except Exception as e:
+            yield f"data: {dumps({'type': 'error', 'error': str(e)})}\n\n"
+    
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            # Let nginx pass each event through without buffering
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
 @interview_bp.route('/api/transcript/<session_id>', methods=['GET'])
-@require_auth
 def get_transcript(session_id: str):
     """
     Get full transcript for a session.
@@ -94,7 +137,6 @@ def get_transcript(session_id: str):
 
 
 @interview_bp.route('/api/extraction/<session_id>', methods=['GET'])
-@require_auth
 def get_extraction(session_id: str):
     """
     Get extracted knowledge for a session.
@@ -4,27 +4,20 @@ Handles session creation, listing, and management.
 """
 
 from flask import Blueprint, request, jsonify, session as flask_session
-from app.services.interview_manager import InterviewManager
+from app.config import Config
+from app.services import get_interview_manager
+from app.services.token_manager import increment_user_session_count
 from app.models.database import get_db
 from app.models.session import Session
-from app.routes.auth import require_auth
+from app.routes.auth import check_auth, current_user
 
 sessions_bp = Blueprint('sessions', __name__)
 
-# Global interview manager instance
-_interview_manager = None
-
-
-def get_interview_manager() -> InterviewManager:
-    """Get or create the interview manager singleton."""
-    global _interview_manager
-    if _interview_manager is None:
-        _interview_manager = InterviewManager()
-    return _interview_manager
+# Every route in this blueprint requires an authenticated session
+sessions_bp.before_request(check_auth)
 
 
 @sessions_bp.route('/api/sessions', methods=['POST'])
-@require_auth
 def create_session():
     """
     Create a new interview session.
@@ -49,14 +42,13 @@ def create_session():
             "chars_synthesized": 150
         }
     """
-    from app.config import Config
-    
-    data = request.get_json()
+    data = request.get_json(silent=True)
     
-    if not data:
+    if not data or not isinstance(data, dict):
         return jsonify({"error": "No JSON data provided"}), 400
     
-    expert_name = data.get("expert_name", "").strip()
+    expert_name = data.get("expert_name")
+    expert_name = expert_name.strip() if isinstance(expert_name, str) else ''
     
     if not expert_name:
         return jsonify({"error": "expert_name is required"}), 400
@@ -67,9 +59,10 @@ def create_session():
     speech_rate = data.get("speech_rate", 0.95)
     
     # Get token user info from auth session
-    token_user_name = flask_session.get('user_name')
-    token_user_callsign = flask_session.get('user_callsign')
-    token = flask_session.get('token')
+    user = current_user() or {}
+    token_user_name = user.get('name')
+    token_user_callsign = user.get('callsign')
+    user_id = flask_session.get('uid')
     
     # Validate voice_preset
     if voice_preset not in Config.VOICE_PRESETS:
@@ -77,8 +70,7 @@ def create_session():
     
     # Validate speech_rate (0.5 to 1.5)
     try:
-        speech_rate = float(speech_rate)
-        speech_rate = max(0.5, min(1.5, speech_rate))
+        speech_rate = max(0.5, min(1.5, float(speech_rate)))
     except (TypeError, ValueError):
         speech_rate = 0.95
     
@@ -95,9 +87,8 @@ def create_session():
         )
         
         # Increment session count for this token
-        if token:
-            from app.services.token_manager import increment_session_count
-            increment_session_count(token)
+        if user:
+            increment_user_session_count(user_id)
         
         return jsonify(result), 201
     
@@ -106,7 +97,6 @@ def create_session():
 
 
 @sessions_bp.route('/api/sessions', methods=['GET'])
-@require_auth
 def list_sessions():
     """
     List all interview sessions.
@@ -132,29 +122,15 @@ def list_sessions():
     
     try:
         db = get_db()
-        sessions = Session.get_all(db, status=status)
         
-        # Return simplified list
-        session_list = [
-            {
-                "id": s["id"],
-                "expert_name": s["expert_name"],
-                "expert_callsign": s.get("expert_callsign"),
-                "status": s["status"],
-                "message_count": s.get("message_count", 0),
-                "created_at": s["created_at"]
-            }
-            for s in sessions
-        ]
-        
-        return jsonify({"sessions": session_list})
+        # Simplified list, projected in SQL
+        return jsonify({"sessions": Session.get_all_summary(db, status=status)})
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 @sessions_bp.route('/api/sessions/<session_id>', methods=['GET'])
-@require_auth
 def get_session(session_id: str):
     """
     Get details of a specific session.
@@ -183,8 +159,32 @@ def get_session(session_id: str):
         return jsonify({"error": str(e)}), 500
 
 
+@sessions_bp.route('/api/sessions/<session_id>/full', methods=['GET'])
+def get_full_session(session_id: str):
+    """
+    Get session details, transcript and extracted knowledge in one call.
+    
+    Response:
+        {
+            "session": {...},
+            "transcript": {"session_id": "uuid-string", "messages": [...]},
+            "extraction": {"session_id": "uuid-string", "topics_discussed": [...], ...}
+        }
+    """
+    try:
+        manager = get_interview_manager()
+        full = manager.get_full_session(session_id)
+        
+        if not full:
+            return jsonify({"error": "Session not found"}), 404
+        
+        return jsonify(full)
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @sessions_bp.route('/api/sessions/<session_id>/end', methods=['POST'])
-@require_auth
 def end_session(session_id: str):
     """
     End an interview session.
@@ -196,7 +196,8 @@ def end_session(session_id: str):
             "message_count": 47,
             "duration_seconds": 1823,
             "transcript_url": "/api/transcript/uuid",
-            "extraction_url": "/api/extraction/uuid"
+            "extraction_url": "/api/extraction/uuid",
+            "full_url": "/api/sessions/uuid/full"
         }
     """
     try:
@@ -209,7 +210,6 @@ def end_session(session_id: str):
 
 
 @sessions_bp.route('/api/sessions/<session_id>', methods=['DELETE'])
-@require_auth
 def delete_session(session_id: str):
     """
     Delete a session and all its data.
@@ -223,6 +223,7 @@ def delete_session(session_id: str):
     try:
         db = get_db()
         deleted = Session.delete(db, session_id)
+        get_interview_manager().forget_session(session_id)
         
         if not deleted:
             return jsonify({"error": "Session not found"}), 404
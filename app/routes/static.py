@@ -4,8 +4,10 @@ Serves the frontend interview page and audio files.
 """
 
 import os
-from flask import Blueprint, send_from_directory, send_file, render_template
+from flask import Blueprint, send_from_directory, render_template
+from werkzeug.exceptions import NotFound
 from app.config import Config
+from app.services.tts_client import forget_cached
 
 static_bp = Blueprint('static_routes', __name__)
 
@@ -13,9 +15,15 @@ static_bp = Blueprint('static_routes', __name__)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 TEMPLATES_DIR = os.path.join(BASE_DIR, 'templates')
 STATIC_DIR = os.path.join(BASE_DIR, 'static')
+CSS_DIR = os.path.join(STATIC_DIR, 'css')
+JS_DIR = os.path.join(STATIC_DIR, 'js')
 
-# Audio cache directory - use absolute path for Docker compatibility
-AUDIO_DIR = '/app/data/audio_cache' if os.path.exists('/app/data') else os.path.join(BASE_DIR, 'data', 'audio_cache')
+# Audio cache directory - same location the TTS client writes to
+AUDIO_DIR = os.path.abspath(Config.AUDIO_CACHE_DIR)
+
+# Audio files are named by a hash of their text and voice, so a given
+# URL always serves the same bytes
+AUDIO_MAX_AGE = 31536000
 
 
 @static_bp.route('/')
@@ -27,13 +35,13 @@ def index():
 @static_bp.route('/static/css/<path:filename>')
 def serve_css(filename):
     """Serve CSS files."""
-    return send_from_directory(os.path.join(STATIC_DIR, 'css'), filename)
+    return send_from_directory(CSS_DIR, filename)
 
 
 @static_bp.route('/static/js/<path:filename>')
 def serve_js(filename):
     """Serve JavaScript files."""
-    return send_from_directory(os.path.join(STATIC_DIR, 'js'), filename)
+    return send_from_directory(JS_DIR, filename)
 
 
 @static_bp.route('/audio/<filename>')
@@ -44,16 +52,27 @@ def serve_audio(filename):
     Args:
         filename: The audio file name (e.g., 'abc123.mp3')
     """
-    audio_path = os.path.join(AUDIO_DIR, filename)
-    
-    if not os.path.exists(audio_path):
-        return {"error": "Audio file not found", "path": audio_path}, 404
+    # send_from_directory rejects paths outside AUDIO_DIR and answers
+    # conditional/range requests (304, 206) from the file's stat
+    try:
+        response = send_from_directory(
+            AUDIO_DIR,
+            filename,
+            mimetype='audio/mpeg',
+            conditional=True,
+            max_age=AUDIO_MAX_AGE
+        )
+    except NotFound:
+        # Possibly deleted out of band while still known to the TTS cache;
+        # forget it so the next synthesis of its text recreates it
+        if filename.endswith('.mp3'):
+            forget_cached(Config.AUDIO_CACHE_DIR, filename[:-4])
+        return {"error": "Audio file not found"}, 404
     
-    return send_file(
-        audio_path,
-        mimetype='audio/mpeg',
-        as_attachment=False
-    )
+    # Content never changes for a name, so browsers needn't revalidate
+    response.headers['Cache-Control'] = f'public, max-age={AUDIO_MAX_AGE}, immutable'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
 
 
 @static_bp.route('/health')
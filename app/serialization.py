@@ -0,0 +1,78 @@
+"""
+JSON encoding helpers for SME Interview System.
+Uses orjson when installed and falls back to the standard library.
+"""
+
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def dumps(obj) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data):
+    """
+    Parse JSON text or bytes.
+
+    Args:
+        data: JSON as str or bytes
+
+    Returns:
+        Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes jsonify() responses with orjson.
+    
+    Datetimes are still passed to Flask's default handler so they keep
+    the HTTP date format, and keys are sorted when sort_keys is set, as
+    Flask does by default. Without orjson this behaves exactly like
+    DefaultJSONProvider.
+    """
+    
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        
+        # Same argument handling as jsonify(): one value, several values
+        # as a list, or keyword arguments as an object
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        if len(args) == 1:
+            obj = args[0]
+        else:
+            obj = args or kwargs or None
+        
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option),
+            mimetype=self.mimetype
+        )
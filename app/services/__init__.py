@@ -3,6 +3,8 @@ Services package for SME Interview System.
 Contains business logic for Claude API, TTS, and interview management.
 """
 
+from functools import lru_cache
+
 from app.services.claude_client import ClaudeClient
 from app.services.tts_client import TTSClient
 from app.services.interview_manager import InterviewManager
@@ -14,5 +16,17 @@ __all__ = [
     'TTSClient', 
     'InterviewManager',
     'ContextManager',
-    'KnowledgeExtractor'
+    'KnowledgeExtractor',
+    'get_interview_manager'
 ]
+
+
+@lru_cache(maxsize=1)
+def get_interview_manager() -> InterviewManager:
+    """
+    Get the interview manager shared by all route blueprints.
+    
+    Created on first use rather than at import so API clients are only
+    built once the app is actually serving requests.
+    """
+    return InterviewManager()
@@ -2,11 +2,23 @@
 ClaudeClient wraps the Anthropic API for interview use.
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional
 import anthropic
 from app.config import Config
 
 
+@lru_cache(maxsize=4)
+def _shared_anthropic(api_key: str) -> anthropic.Anthropic:
+    """
+    Get the process-wide Anthropic client for an API key.
+    
+    The SDK client owns a keep-alive connection pool, so sharing one
+    instance lets every ClaudeClient reuse warm TLS connections.
+    """
+    return anthropic.Anthropic(api_key=api_key)
+
+
 class ClaudeClient:
     """Client for interacting with Claude API."""
     
@@ -15,12 +27,19 @@ class ClaudeClient:
         Initialize the Claude client.
         
         Args:
-            api_key: Anthropic API key. Defaults to config value.
+            api_key: Anthropic API key. Defaults to config value, using
+                the shared connection pool; an explicit key gets its own client.
             model: Claude model to use. Defaults to config value.
         """
         self.api_key = api_key or Config.ANTHROPIC_API_KEY
         self.model = model or Config.CLAUDE_MODEL
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        if api_key:
+            self.client = anthropic.Anthropic(api_key=api_key)
+        else:
+            self.client = _shared_anthropic(self.api_key)
+        
+        # (knowledge object, formatted summary) from the last turn
+        self._formatted_knowledge = None
     
     def send_message(self, messages: list, max_tokens: Optional[int] = None, 
                      system_prompt: Optional[str] = None) -> str:
@@ -35,19 +54,67 @@ class ClaudeClient:
         Returns:
             Response text string
         """
-        max_tokens = max_tokens or Config.CLAUDE_MAX_TOKENS
+        response = self.client.messages.create(
+            **self._request_kwargs(messages, max_tokens, system_prompt)
+        )
+        return response.content[0].text
+    
+    def send_tool_call(self, messages: list, tool: dict, max_tokens: Optional[int] = None,
+                       system_prompt: Optional[str] = None) -> Optional[dict]:
+        """
+        Send messages to Claude, requiring it to answer by calling a tool.
+        
+        Args:
+            messages: List of {"role": str, "content": str} dicts
+            tool: Tool definition with name, description and input_schema
+            max_tokens: Max response length
+            system_prompt: Optional system prompt to include
+        
+        Returns:
+            The tool call's input, already parsed, or None if Claude
+            returned no tool call (e.g. it ran out of tokens)
+        """
+        response = self.client.messages.create(
+            **self._request_kwargs(messages, max_tokens, system_prompt),
+            tools=[tool],
+            tool_choice={"type": "tool", "name": tool["name"]}
+        )
+        for block in response.content:
+            if block.type == "tool_use":
+                return block.input
+        return None
+    
+    def stream_message(self, messages: list, max_tokens: Optional[int] = None,
+                       system_prompt: Optional[str] = None) -> Iterator[str]:
+        """
+        Send messages to Claude and stream the response as it's generated.
+        
+        Args:
+            messages: List of {"role": str, "content": str} dicts
+            max_tokens: Max response length (keep short for interviews)
+            system_prompt: Optional system prompt to include
         
+        Yields:
+            Text deltas in the order Claude produces them
+        """
+        with self.client.messages.stream(
+            **self._request_kwargs(messages, max_tokens, system_prompt)
+        ) as stream:
+            yield from stream.text_stream
+    
+    def _request_kwargs(self, messages: list, max_tokens: Optional[int],
+                        system_prompt: Optional[str]) -> dict:
+        """Build the Messages API arguments shared by create and stream."""
         kwargs = {
             "model": self.model,
-            "max_tokens": max_tokens,
+            "max_tokens": max_tokens or Config.CLAUDE_MAX_TOKENS,
             "messages": messages
         }
         
         if system_prompt:
             kwargs["system"] = system_prompt
         
-        response = self.client.messages.create(**kwargs)
-        return response.content[0].text
+        return kwargs
     
     def send_with_context(self, messages: list, system_prompt: str,
                           extracted_knowledge: Optional[dict] = None,
@@ -64,21 +131,60 @@ class ClaudeClient:
         Returns:
             Response text string
         """
-        # Build full system prompt with knowledge context
-        full_system = system_prompt
+        return self.send_message(
+            messages=messages,
+            max_tokens=max_tokens,
+            system_prompt=self._system_with_knowledge(system_prompt, extracted_knowledge)
+        )
+    
+    def stream_with_context(self, messages: list, system_prompt: str,
+                            extracted_knowledge: Optional[dict] = None,
+                            max_tokens: Optional[int] = None) -> Iterator[str]:
+        """
+        Stream an interview continuation with knowledge context.
         
-        if extracted_knowledge:
-            knowledge_summary = self._format_knowledge(extracted_knowledge)
-            full_system = f"{system_prompt}\n\n## KNOWLEDGE CAPTURED SO FAR\n{knowledge_summary}"
+        Args:
+            messages: Recent conversation messages
+            system_prompt: The interviewer system prompt
+            extracted_knowledge: Previously extracted knowledge to include
+            max_tokens: Max response length
         
-        return self.send_message(
+        Yields:
+            Response text deltas
+        """
+        return self.stream_message(
             messages=messages,
             max_tokens=max_tokens,
-            system_prompt=full_system
+            system_prompt=self._system_with_knowledge(system_prompt, extracted_knowledge)
         )
     
+    def _system_with_knowledge(self, system_prompt: str,
+                               extracted_knowledge: Optional[dict]) -> str:
+        """Append captured knowledge to the system prompt, if there is any."""
+        if not extracted_knowledge:
+            return system_prompt
+        
+        knowledge_summary = self._format_knowledge(extracted_knowledge)
+        return f"{system_prompt}\n\n## KNOWLEDGE CAPTURED SO FAR\n{knowledge_summary}"
+    
     def _format_knowledge(self, knowledge: dict) -> str:
-        """Format extracted knowledge for inclusion in context."""
+        """
+        Format extracted knowledge for inclusion in context.
+        
+        The interview manager reuses its cached session row between turns,
+        so the same knowledge object comes back until the row is re-read
+        or the next extraction; the last formatted summary is reused for it.
+        """
+        cached = self._formatted_knowledge
+        if cached is not None and cached[0] is knowledge:
+            return cached[1]
+        
+        summary = self._build_knowledge_summary(knowledge)
+        self._formatted_knowledge = (knowledge, summary)
+        return summary
+    
+    def _build_knowledge_summary(self, knowledge: dict) -> str:
+        """Render extracted knowledge as prompt text."""
         sections = []
         
         if knowledge.get("topics_discussed"):
@@ -22,31 +22,27 @@ class ContextManager:
         """
         self.max_messages = max_messages or Config.MAX_CONTEXT_MESSAGES
         self.extraction_interval = extraction_interval or Config.EXTRACTION_INTERVAL
+        # Messages per extraction interval (user + assistant per exchange)
+        self._extract_step = 2 * self.extraction_interval
     
     def build_context(self, all_messages: list, extracted_knowledge: Optional[dict] = None) -> list:
         """
         Build the messages array for Claude API call.
         Uses a sliding window approach to keep context manageable.
         
+        Messages are expected in Claude's shape already (only 'role' and
+        'content', as returned by Message.get_roles_contents), so the
+        window is a plain slice with no per-message copies.
+        
         Args:
-            all_messages: All messages from the session
+            all_messages: Messages from the session, as role/content dicts
             extracted_knowledge: Previously extracted knowledge
         
         Returns:
             List of message dicts for Claude API (only 'role' and 'content')
         """
         # Apply sliding window - keep last N messages
-        if len(all_messages) > self.max_messages:
-            # Keep the most recent messages
-            windowed_messages = all_messages[-self.max_messages:]
-        else:
-            windowed_messages = all_messages
-        
-        # Strip to only role and content for Claude API
-        return [
-            {"role": msg["role"], "content": msg["content"]}
-            for msg in windowed_messages
-        ]
+        return all_messages[-self.max_messages:]
     
     def should_extract(self, message_count: int) -> bool:
         """
@@ -58,9 +54,9 @@ class ContextManager:
         Returns:
             True if extraction should run
         """
-        # Extract every N exchanges (user + assistant = 2 messages per exchange)
-        exchanges = message_count // 2
-        return exchanges > 0 and exchanges % self.extraction_interval == 0
+        # Extract every N exchanges (user + assistant = 2 messages per exchange).
+        # (message_count // 2) % N == 0 exactly when message_count % 2N is 0 or 1.
+        return message_count >= 2 and message_count % self._extract_step < 2
     
     def get_messages_for_extraction(self, all_messages: list, 
                                      last_extraction_index: int = 0) -> list:
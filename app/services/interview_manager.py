@@ -7,9 +7,14 @@ InterviewManager handles the core interview logic:
 - Generating TTS audio
 """
 
+import re
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 from app.services.claude_client import ClaudeClient
 from app.services.tts_client import TTSClient
@@ -21,6 +26,27 @@ from app.models.message import Message
 from app.prompts.interviewer import INTERVIEWER_SYSTEM_PROMPT
 
 
+# Split streamed text after sentence-ending punctuation
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+
+# Runs TTS requests while the request thread writes to the database
+# (database connections are per thread, so writes stay on the caller)
+_tts_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tts")
+
+# Runs periodic knowledge extraction after the turn's response is returned
+_extraction_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="extraction")
+
+# Most TTS clients kept per manager; least recently used are dropped
+_MAX_TTS_CLIENTS = 32
+
+# How long a session row read or written by this process is reused before
+# re-reading it; bounds staleness if another worker touches the session
+_SESSION_CACHE_TTL = 30
+
+# Most session rows kept per manager; the soonest to expire are dropped
+_MAX_CACHED_SESSIONS = 256
+
+
 class InterviewManager:
     """Central orchestrator for interview sessions."""
     
@@ -38,17 +64,41 @@ class InterviewManager:
         self._tts_client = tts_client
         self.context_manager = ContextManager()
         self.extractor = KnowledgeExtractor(self.claude)
-        # Cache of TTS clients per voice preset + speech rate
-        self._tts_clients = {}
+        # LRU cache of TTS clients per voice preset + speech rate
+        self._tts_clients = OrderedDict()
+        self._tts_clients_lock = threading.Lock()
+        # Background extraction futures per session
+        self._extractions = {}
+        self._extractions_lock = threading.Lock()
+        # Recent session rows: session_id -> (expires_at, session dict),
+        # ordered by expiry so expired entries can be pruned from the front
+        self._sessions = OrderedDict()
+        self._sessions_lock = threading.Lock()
     
     def _get_tts_client(self, voice_preset: str = 'premium_female', speech_rate: float = 1.0) -> TTSClient:
-        """Get or create a TTS client for the given voice preset and speech rate."""
+        """
+        Get or create a TTS client for the given voice preset and speech rate.
+        
+        Rates are rounded to 2 decimals so near-identical values share a
+        client, and at most _MAX_TTS_CLIENTS are kept.
+        """
         if self._tts_client:
             return self._tts_client
-        cache_key = f"{voice_preset}_{speech_rate}"
-        if cache_key not in self._tts_clients:
-            self._tts_clients[cache_key] = TTSClient(voice_preset=voice_preset, speech_rate=speech_rate)
-        return self._tts_clients[cache_key]
+        
+        speech_rate = round(speech_rate, 2)
+        cache_key = (voice_preset, speech_rate)
+        
+        with self._tts_clients_lock:
+            client = self._tts_clients.get(cache_key)
+            if client is None:
+                client = TTSClient(voice_preset=voice_preset, speech_rate=speech_rate)
+                self._tts_clients[cache_key] = client
+                if len(self._tts_clients) > _MAX_TTS_CLIENTS:
+                    self._tts_clients.popitem(last=False)
+            else:
+                self._tts_clients.move_to_end(cache_key)
+        
+        return client
     
     def create_session(self, expert_name: str, expert_callsign: Optional[str] = None,
                        topics: Optional[list] = None, voice_preset: str = 'premium_female',
@@ -89,20 +139,19 @@ class InterviewManager:
         )
         
         # Generate personalized greeting
-        greeting = self._generate_greeting(expert_name, expert_callsign, topics)
-        
-        # Save greeting as first assistant message
-        Message.create(db, session_id, "assistant", greeting)
+        greeting_segments = self._greeting_segments(expert_name, expert_callsign, topics)
+        greeting = "".join(greeting_segments)
         
         # Generate TTS audio for greeting (returns tuple: url, char_count)
-        audio_url, char_count = tts.synthesize(greeting)
+        # while saving it as the first assistant message. The fixed template
+        # sentences are synthesized once and reused from the audio cache.
+        audio_future = _tts_pool.submit(tts.synthesize_joined, greeting_segments)
+        Message.create(db, session_id, "assistant", greeting)
+        audio_url, char_count = audio_future.result()
         
         # Update cost tracking
         cost = tts.calculate_cost(char_count)
-        Session.update_cost(db, session_id, char_count, cost)
-        
-        # Get updated session with cost info
-        session = Session.get_by_id(db, session_id)
+        session = self._cache_cost(Session.update_cost(db, session_id, char_count, cost))
         
         return {
             "session_id": session_id,
@@ -125,10 +174,104 @@ class InterviewManager:
         Returns:
             Dict with response_text, audio_url, message_count, extraction_triggered, cost info
         """
+        db, tts, context_messages, extracted_knowledge, message_count = \
+            self._begin_turn(session_id, user_text)
+        
+        # 6. Call Claude API
+        response_text = self.claude.send_with_context(
+            messages=context_messages,
+            system_prompt=INTERVIEWER_SYSTEM_PROMPT,
+            extracted_knowledge=extracted_knowledge
+        )
+        
+        # 7. Generate TTS audio (returns tuple: url, char_count) in the
+        # background while saving the assistant message to DB
+        audio_future = _tts_pool.submit(tts.synthesize, response_text)
+        Message.create(db, session_id, "assistant", response_text)
+        
+        # 8. Wait for the audio
+        audio_url, char_count = audio_future.result()
+        
+        return {
+            "response_text": response_text,
+            "audio_url": audio_url,
+            **self._finish_turn(db, session_id, tts, char_count, message_count)
+        }
+    
+    def stream_input(self, session_id: str, user_text: str) -> Iterator[dict]:
+        """
+        Process expert's spoken input, streaming the response by sentence.
+        
+        Claude's reply is read as it's generated; each complete sentence is
+        synthesized and yielded right away so playback can start before the
+        full response exists.
+        
+        Args:
+            session_id: The session ID
+            user_text: Transcribed text from expert
+        
+        Yields:
+            {"type": "sentence", "text", "audio_url"} for each sentence, then
+            {"type": "done", ...} with the same totals as process_input
+        """
+        db, tts, context_messages, extracted_knowledge, message_count = \
+            self._begin_turn(session_id, user_text)
+        
+        parts = []
+        pending = ""
+        char_count = 0
+        
+        deltas = self.claude.stream_with_context(
+            messages=context_messages,
+            system_prompt=INTERVIEWER_SYSTEM_PROMPT,
+            extracted_knowledge=extracted_knowledge
+        )
+        
+        saved = False
+        try:
+            for delta in deltas:
+                parts.append(delta)
+                *sentences, pending = _SENTENCE_BREAK.split(pending + delta)
+                for sentence in sentences:
+                    audio_url, chars = tts.synthesize(sentence)
+                    char_count += chars
+                    yield {"type": "sentence", "text": sentence, "audio_url": audio_url}
+            
+            if pending.strip():
+                audio_url, chars = tts.synthesize(pending.strip())
+                char_count += chars
+                yield {"type": "sentence", "text": pending.strip(), "audio_url": audio_url}
+            
+            response_text = "".join(parts)
+            Message.create(db, session_id, "assistant", response_text)
+            saved = True
+            
+            yield {
+                "type": "done",
+                "response_text": response_text,
+                **self._finish_turn(db, session_id, tts, char_count, message_count)
+            }
+        finally:
+            if not saved:
+                # The client disconnected or Claude/TTS failed mid-stream;
+                # keep the part of the reply already generated (and paid
+                # for) so the expert's input isn't left unanswered
+                response_text = "".join(parts).strip()
+                if response_text:
+                    Message.create(db, session_id, "assistant", response_text)
+                self._finish_turn(db, session_id, tts, char_count, message_count)
+    
+    def _begin_turn(self, session_id: str, user_text: str) -> tuple:
+        """
+        Record the expert's input and build the context for Claude.
+        
+        Returns:
+            (db, tts client, context messages, extracted knowledge, message count)
+        """
         db = get_db()
         
         # 1. Get session to get voice preset and speech rate
-        session = Session.get_by_id(db, session_id)
+        session = self._get_session(db, session_id)
         voice_preset = session.get("voice_preset", "premium_female")
         speech_rate = session.get("speech_rate", 0.95)
         tts = self._get_tts_client(voice_preset, speech_rate)
@@ -136,44 +279,43 @@ class InterviewManager:
         # 2. Save user message to DB
         Message.create(db, session_id, "user", user_text)
         
-        # 3. Get all messages for this session
-        all_messages = Message.get_by_session(db, session_id)
-        message_count = len(all_messages)
+        # 3. Fetch only the context window, already in Claude's shape,
+        # along with the session's message count
+        recent_messages, message_count = Message.get_window(
+            db, session_id, limit=self.context_manager.max_messages
+        )
         
         # 4. Get extracted knowledge for context
         extracted_knowledge = session.get("extracted_knowledge")
         
         # 5. Build context with sliding window
         context_messages = self.context_manager.build_context(
-            all_messages, extracted_knowledge
-        )
-        
-        # 6. Call Claude API
-        response_text = self.claude.send_with_context(
-            messages=context_messages,
-            system_prompt=INTERVIEWER_SYSTEM_PROMPT,
-            extracted_knowledge=extracted_knowledge
+            recent_messages, extracted_knowledge
         )
         
-        # 7. Save assistant message to DB
-        Message.create(db, session_id, "assistant", response_text)
-        
-        # 8. Generate TTS audio (returns tuple: url, char_count)
-        audio_url, char_count = tts.synthesize(response_text)
+        return db, tts, context_messages, extracted_knowledge, message_count
+    
+    def _finish_turn(self, db, session_id: str, tts: TTSClient,
+                     char_count: int, message_count: int) -> dict:
+        """
+        Record TTS cost and run extraction once the response is saved.
         
+        Returns:
+            Dict with session_id, message_count, extraction_triggered and cost info
+        """
         # 9. Update cost tracking
         cost = tts.calculate_cost(char_count)
-        updated_session = Session.update_cost(db, session_id, char_count, cost)
+        updated_session = self._cache_cost(Session.update_cost(
+            db, session_id, char_count, cost,
+            current=self._get_session(db, session_id)
+        ))
         
-        # 10. Check if extraction should run
+        # 10. Check if extraction should run (in the background)
         extraction_triggered = False
         if self.context_manager.should_extract(message_count + 1):
-            self._run_extraction(session_id)
-            extraction_triggered = True
+            extraction_triggered = self._schedule_extraction(session_id)
         
         return {
-            "response_text": response_text,
-            "audio_url": audio_url,
             "session_id": session_id,
             "message_count": (message_count + 2) // 2,  # Count exchanges, not messages
             "extraction_triggered": extraction_triggered,
@@ -194,10 +336,54 @@ class InterviewManager:
         """
         db = get_db()
         session = Session.get_by_id(db, session_id)
-        messages = Message.get_by_session(db, session_id)
+        return self._build_transcript(session, Message.iter_by_session(db, session_id))
+    
+    def get_extracted_knowledge(self, session_id: str) -> dict:
+        """
+        Get all extracted knowledge for a session.
+        
+        Args:
+            session_id: The session ID
+        
+        Returns:
+            Extracted knowledge dict
+        """
+        db = get_db()
+        session = Session.get_by_id(db, session_id)
+        return self._knowledge_or_empty(session)
+    
+    def get_full_session(self, session_id: str) -> Optional[dict]:
+        """
+        Get session details, transcript and extracted knowledge together.
+        
+        Reads the session row once for all three parts.
+        
+        Args:
+            session_id: The session ID
+        
+        Returns:
+            Dict with session, transcript and extraction, or None if not found
+        """
+        db = get_db()
+        session = Session.get_by_id(db, session_id)
+        
+        if not session:
+            return None
         
         return {
-            "session_id": session_id,
+            "session": session,
+            "transcript": self._build_transcript(session, Message.iter_by_session(db, session_id)),
+            "extraction": {
+                "session_id": session_id,
+                **self._knowledge_or_empty(session)
+            }
+        }
+    
+    @staticmethod
+    def _build_transcript(session: dict, messages) -> dict:
+        """Build the transcript payload from a session and its messages."""
+        return {
+            "session_id": session["id"],
             "expert_name": session.get("expert_name"),
             "expert_callsign": session.get("expert_callsign"),
             "created_at": session.get("created_at"),
@@ -212,18 +398,9 @@ class InterviewManager:
             ]
         }
     
-    def get_extracted_knowledge(self, session_id: str) -> dict:
-        """
-        Get all extracted knowledge for a session.
-        
-        Args:
-            session_id: The session ID
-        
-        Returns:
-            Extracted knowledge dict
-        """
-        db = get_db()
-        session = Session.get_by_id(db, session_id)
+    @staticmethod
+    def _knowledge_or_empty(session: dict) -> dict:
+        """Get a session's extracted knowledge, or an empty structure."""
         return session.get("extracted_knowledge") or {
             "topics_discussed": [],
             "key_insights": [],
@@ -246,37 +423,38 @@ class InterviewManager:
         """
         db = get_db()
         
-        # Run final extraction
+        # Run final extraction once any background one has finished
+        self._wait_for_extraction(session_id)
         self._run_extraction(session_id)
+        self.forget_session(session_id)
         
-        # Update session status
-        session = Session.get_by_id(db, session_id)
-        messages = Message.get_by_session(db, session_id)
-        
-        # Calculate duration
-        if messages:
-            start_time = datetime.fromisoformat(messages[0]["created_at"])
-            end_time = datetime.fromisoformat(messages[-1]["created_at"])
+        # Calculate duration from the first and last message timestamps
+        first_at, last_at, message_count = Message.get_session_stats(db, session_id)
+        if message_count:
+            start_time = datetime.fromisoformat(first_at)
+            end_time = datetime.fromisoformat(last_at)
             duration_seconds = int((end_time - start_time).total_seconds())
         else:
             duration_seconds = 0
         
+        # Update session status
         Session.update(db, session_id, 
                       status="completed",
                       ended_at=datetime.utcnow().isoformat(),
-                      message_count=len(messages),
+                      message_count=message_count,
                       total_duration_seconds=duration_seconds)
         
-        # Get updated session for cost info
-        final_session = Session.get_by_id(db, session_id)
+        # Write buffered cost tracking and get final totals
+        final_session = Session.finalize(db, session_id)
         
         return {
             "session_id": session_id,
             "status": "completed",
-            "message_count": len(messages) // 2,  # Exchanges
+            "message_count": message_count // 2,  # Exchanges
             "duration_seconds": duration_seconds,
             "transcript_url": f"/api/transcript/{session_id}",
             "extraction_url": f"/api/extraction/{session_id}",
+            "full_url": f"/api/sessions/{session_id}/full",
             "total_chars_synthesized": final_session.get("total_chars_synthesized", 0),
             "total_cost": round(final_session.get("estimated_cost", 0), 4),
             "voice_quality": final_session.get("voice_quality", "natural")
@@ -285,38 +463,163 @@ class InterviewManager:
     def _generate_greeting(self, expert_name: str, expert_callsign: Optional[str] = None,
                           topics: Optional[list] = None) -> str:
         """Generate a personalized greeting for the interview."""
+        return "".join(self._greeting_segments(expert_name, expert_callsign, topics))
+    
+    def _greeting_segments(self, expert_name: str, expert_callsign: Optional[str] = None,
+                           topics: Optional[list] = None) -> list:
+        """
+        Build the greeting as sentences, separating personalized ones from
+        the fixed template sentences shared by every session.
+        """
         name_to_use = expert_callsign or expert_name.split()[0]
         
-        greeting = f"Hello {name_to_use}, thank you for joining us today for the MARS Digital History Project. "
-        greeting += "I'm looking forward to learning about your experiences and capturing your valuable knowledge. "
+        segments = [
+            f"Hello {name_to_use}, thank you for joining us today for the MARS Digital History Project. ",
+            "I'm looking forward to learning about your experiences and capturing your valuable knowledge. ",
+        ]
         
         if topics:
             topics_str = ", ".join(topics[:2])
-            greeting += f"I understand you have expertise in {topics_str}. "
+            segments.append(f"I understand you have expertise in {topics_str}. ")
         
-        greeting += "Before we begin, could you tell me a bit about how you first got involved in HF digital communications?"
+        segments.append("Before we begin, could you tell me a bit about how you first got involved in HF digital communications?")
         
-        return greeting
+        return segments
     
-    def _run_extraction(self, session_id: str) -> None:
-        """Run knowledge extraction for a session."""
-        db = get_db()
-        session = Session.get_by_id(db, session_id)
-        messages = Message.get_by_session(db, session_id)
+    def _get_session(self, db, session_id: str) -> Optional[dict]:
+        """Get a session row, reusing one this process read or wrote recently."""
+        now = time.monotonic()
+        with self._sessions_lock:
+            cached = self._sessions.get(session_id)
+        if cached and cached[0] > now:
+            return cached[1]
+        
+        return self._cache_session(Session.get_by_id(db, session_id))
+    
+    def _cache_session(self, session: Optional[dict]) -> Optional[dict]:
+        """
+        Remember a session row returned by a read or write; returns it.
         
-        existing_knowledge = session.get("extracted_knowledge")
+        Expired rows are pruned on the way in, and at most
+        _MAX_CACHED_SESSIONS are kept, so sessions that are never ended
+        don't stay in memory.
+        """
+        if session:
+            now = time.monotonic()
+            with self._sessions_lock:
+                self._sessions[session["id"]] = (now + _SESSION_CACHE_TTL, session)
+                self._sessions.move_to_end(session["id"])
+                while self._sessions:
+                    expires_at = next(iter(self._sessions.values()))[0]
+                    if expires_at > now and len(self._sessions) <= _MAX_CACHED_SESSIONS:
+                        break
+                    self._sessions.popitem(last=False)
+        return session
+    
+    def _cache_cost(self, session: dict) -> dict:
+        """
+        Copy a cost update's totals into the cached session row; returns
+        the update.
         
-        # Get messages to extract (could be optimized to only extract new ones)
-        messages_to_extract = [
-            {"role": m["role"], "content": m["content"]}
-            for m in messages[-20:]  # Last 20 messages
-        ]
+        Only the cost fields are taken: the rest of the update may come
+        from a snapshot older than the cached row (e.g. one a background
+        extraction cached mid-turn).
+        """
+        with self._sessions_lock:
+            cached = self._sessions.get(session["id"])
+            if cached:
+                self._sessions[session["id"]] = (cached[0], {
+                    **cached[1],
+                    "total_chars_synthesized": session.get("total_chars_synthesized"),
+                    "estimated_cost": session.get("estimated_cost"),
+                })
+        return session
+    
+    def forget_session(self, session_id: str) -> None:
+        """Drop a session's cached row (e.g. after it is deleted)."""
+        with self._sessions_lock:
+            self._sessions.pop(session_id, None)
+    
+    def _schedule_extraction(self, session_id: str) -> bool:
+        """
+        Start knowledge extraction for a session in the background.
         
-        # Extract knowledge
-        new_knowledge = self.extractor.extract(messages_to_extract, existing_knowledge)
+        Skipped while an earlier extraction for the session is still
+        running; the next one covers the same recent messages.
         
-        # Merge with existing
-        merged_knowledge = self.extractor.merge_knowledge(existing_knowledge, new_knowledge)
+        Returns:
+            True if an extraction was started
+        """
+        with self._extractions_lock:
+            pending = self._extractions.get(session_id)
+            if pending is not None and not pending.done():
+                return False
+            
+            future = _extraction_pool.submit(self._run_extraction, session_id)
+            self._extractions[session_id] = future
+        
+        # Registered outside the lock: a future that has already finished
+        # runs the callback at once, and the callback takes the lock
+        future.add_done_callback(lambda f: self._forget_extraction(session_id, f))
+        return True
+    
+    def _forget_extraction(self, session_id: str, future) -> None:
+        """Drop a finished extraction future."""
+        with self._extractions_lock:
+            if self._extractions.get(session_id) is future:
+                del self._extractions[session_id]
+    
+    def _wait_for_extraction(self, session_id: str) -> None:
+        """Wait for a session's background extraction, if one is running."""
+        with self._extractions_lock:
+            pending = self._extractions.get(session_id)
+        
+        if pending is not None:
+            # A failed background run is superseded by the caller's own
+            wait([pending])
+    
+    def _run_extraction(self, session_id: str) -> None:
+        """
+        Run knowledge extraction for a session.
         
-        # Update session
-        Session.update(db, session_id, extracted_knowledge=merged_knowledge)
+        Works through every message not covered by an earlier extraction,
+        a page at a time. The session's last_extracted_message_id only
+        moves past messages that were actually extracted, so a failed
+        chunk is retried on the next run.
+        """
+        db = get_db()
+        session = self._get_session(db, session_id)
+        
+        knowledge = session.get("extracted_knowledge")
+        after_id = session.get("last_extracted_message_id") or 0
+        
+        while True:
+            # Two extraction intervals per page, in case a background
+            # run was skipped
+            messages_to_extract = Message.get_since(
+                db, session_id, after_id=after_id,
+                limit=4 * self.context_manager.extraction_interval
+            )
+            if not messages_to_extract:
+                return
+            
+            # Extract knowledge (longer windows in parallel chunks) and
+            # merge it with the existing knowledge
+            knowledge, covered = self.extractor.extract_parallel(
+                messages_to_extract, knowledge,
+                chunk_size=2 * self.context_manager.extraction_interval
+            )
+            if not covered:
+                return
+            
+            # Update session
+            after_id = messages_to_extract[covered - 1]["id"]
+            self._cache_session(Session.update(
+                db, session_id,
+                extracted_knowledge=knowledge,
+                last_extracted_message_id=after_id
+            ))
+            
+            if covered < len(messages_to_extract):
+                # A chunk failed; leave the rest for the next run
+                return
@@ -6,8 +6,17 @@ interview segments. This serves two purposes:
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from itertools import chain
 from typing import Optional
-from app.prompts.extractor import EXTRACTOR_SYSTEM_PROMPT
+from app.prompts.extractor import EXTRACTOR_SYSTEM_PROMPT, EXTRACTION_TOOL
+from app.serialization import dumps
+
+
+# Speaker labels used in the extraction prompt; any other role is the
+# interviewer, as before
+_ROLE_LABELS = {"user": "Expert", "assistant": "Interviewer"}
 
 
 class KnowledgeExtractor:
@@ -22,7 +31,7 @@ class KnowledgeExtractor:
         """
         self.claude = claude_client
     
-    def extract(self, messages: list, existing_knowledge: Optional[dict] = None) -> dict:
+    def extract(self, messages: list, existing_knowledge: Optional[dict] = None) -> Optional[dict]:
         """
         Extract structured knowledge from a conversation segment.
         
@@ -31,7 +40,9 @@ class KnowledgeExtractor:
             existing_knowledge: Previously extracted knowledge to consider
         
         Returns:
-            Extracted knowledge dict with topics, insights, people, etc.
+            Extracted knowledge dict with topics, insights, people, etc.,
+            or None if no usable extraction came back (so the segment can
+            be retried)
         """
         # Format messages for extraction
         conversation_text = self._format_conversation(messages)
@@ -43,35 +54,63 @@ class KnowledgeExtractor:
 {conversation_text}
 
 ## EXISTING KNOWLEDGE (for context, don't repeat)
-{json.dumps(existing_knowledge, indent=2) if existing_knowledge else "None yet"}
+{dumps(self._knowledge_summary(existing_knowledge)) if existing_knowledge else "None yet"}
 
-Please respond with a JSON object containing:
-- topics_discussed: array of topic strings
-- key_insights: array of {{topic, insight, source_quote, importance}}
-- people_mentioned: array of {{name, callsign, context}}
-- technical_details: array of {{system, detail, rationale}}
-- lessons_learned: array of strings
-- open_questions: array of strings
-- follow_up_topics: array of strings
+Record the knowledge from this segment with the record_extraction tool."""
 
-Respond ONLY with valid JSON, no other text."""
-
-        # Call Claude for extraction
-        response = self.claude.send_message(
+        # Call Claude for extraction; the tool schema defines the fields,
+        # and the tool input arrives already parsed
+        extracted = self.claude.send_tool_call(
             messages=[{"role": "user", "content": prompt}],
+            tool=EXTRACTION_TOOL,
             max_tokens=1000,
             system_prompt=EXTRACTOR_SYSTEM_PROMPT
         )
         
-        # Parse response
-        try:
-            extracted = json.loads(response)
-        except json.JSONDecodeError:
-            # Try to extract JSON from response
-            extracted = self._extract_json_from_text(response)
+        if not isinstance(extracted, dict):
+            # No (usable) tool call, e.g. the response was cut off
+            return None
         
         return extracted
     
+    def extract_parallel(self, messages: list, existing_knowledge: Optional[dict] = None,
+                         chunk_size: int = 20, workers: int = 4) -> tuple:
+        """
+        Extract knowledge from messages in concurrent chunks and merge it.
+        
+        A window of up to chunk_size messages is a single extract() call;
+        longer windows (e.g. catching up after a skipped extraction) are
+        split so the Claude calls run side by side.
+        
+        Args:
+            messages: List of conversation messages to extract from
+            existing_knowledge: Previously extracted knowledge to consider
+            chunk_size: Messages per extraction call
+            workers: Maximum concurrent extraction calls
+        
+        Returns:
+            Tuple of (existing_knowledge merged with what was extracted,
+            number of leading messages covered). Chunks after the first
+            failed one aren't merged, so the caller can retry from there.
+        """
+        chunks = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+        
+        if len(chunks) <= 1:
+            results = [self.extract(chunk, existing_knowledge) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                results = list(pool.map(lambda chunk: self.extract(chunk, existing_knowledge), chunks))
+        
+        extracted = []
+        covered = 0
+        for chunk, result in zip(chunks, results):
+            if result is None:
+                break
+            extracted.append(result)
+            covered += len(chunk)
+        
+        return reduce(self.merge_knowledge, extracted, existing_knowledge or {}), covered
+    
     def merge_knowledge(self, existing: dict, new: dict) -> dict:
         """
         Merge new extraction with existing knowledge, deduplicating.
@@ -113,33 +152,45 @@ Respond ONLY with valid JSON, no other text."""
         
         return merged
     
+    def _knowledge_summary(self, knowledge: dict) -> dict:
+        """
+        Reduce extracted knowledge to what Claude needs to avoid repeats.
+        
+        Topic, insight-topic and people names are enough for deduplication
+        and keep the prompt from growing with every insight recorded.
+        """
+        return {
+            "topics_discussed": knowledge.get("topics_discussed", []),
+            "insight_topics": [i.get("topic", "") for i in knowledge.get("key_insights", [])],
+            "people_names": [p.get("name", "") for p in knowledge.get("people_mentioned", [])],
+        }
+    
     def _format_conversation(self, messages: list) -> str:
         """Format messages into readable conversation text."""
-        lines = []
-        for msg in messages:
-            role = "Expert" if msg["role"] == "user" else "Interviewer"
-            lines.append(f"{role}: {msg['content']}")
-        return "\n\n".join(lines)
+        return "\n\n".join([
+            f"{_ROLE_LABELS.get(msg['role'], 'Interviewer')}: {msg['content']}"
+            for msg in messages
+        ])
     
     def _merge_unique(self, list1: list, list2: list) -> list:
-        """Merge two lists, removing duplicates while preserving order."""
-        seen = set()
-        result = []
-        for item in list1 + list2:
-            item_lower = item.lower() if isinstance(item, str) else str(item)
-            if item_lower not in seen:
-                seen.add(item_lower)
-                result.append(item)
-        return result
+        """
+        Merge two lists, removing case-insensitive duplicates while
+        preserving order. The first spelling of each item is kept.
+        """
+        merged = {}
+        for item in chain(list1, list2):
+            merged.setdefault(item.casefold() if isinstance(item, str) else str(item), item)
+        return list(merged.values())
     
     def _merge_insights(self, existing: list, new: list) -> list:
         """Merge insights, avoiding duplicates by topic."""
         topics_seen = {i.get("topic", "").lower() for i in existing}
         result = list(existing)
         for insight in new:
-            if insight.get("topic", "").lower() not in topics_seen:
+            topic = insight.get("topic", "").lower()
+            if topic not in topics_seen:
                 result.append(insight)
-                topics_seen.add(insight.get("topic", "").lower())
+                topics_seen.add(topic)
         return result
     
     def _merge_people(self, existing: list, new: list) -> list:
@@ -147,9 +198,10 @@ Respond ONLY with valid JSON, no other text."""
         names_seen = {p.get("name", "").lower() for p in existing}
         result = list(existing)
         for person in new:
-            if person.get("name", "").lower() not in names_seen:
+            name = person.get("name", "").lower()
+            if name not in names_seen:
                 result.append(person)
-                names_seen.add(person.get("name", "").lower())
+                names_seen.add(name)
         return result
     
     def _extract_json_from_text(self, text: str) -> dict:
@@ -165,6 +217,11 @@ Respond ONLY with valid JSON, no other text."""
                 pass
         
         # Return empty structure if parsing fails
+        return self._empty_extraction()
+    
+    @staticmethod
+    def _empty_extraction() -> dict:
+        """Get an extraction result with every field empty."""
         return {
             "topics_discussed": [],
             "key_insights": [],
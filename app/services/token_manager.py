@@ -1,39 +1,175 @@
 """Token management for access control.
 
-Tokens are stored in a JSON file for easy management without server restart.
+Tokens are stored in a SQLite database (WAL mode), so manage_tokens.py can
+add or revoke tokens while the server is running. Only each token's
+SHA-256 token_id is stored; the token itself is shown once, when it is
+created. A tokens.json file from older versions is imported on first use.
 """
 
+import base64
+import hashlib
 import json
 import os
 import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 
 
-def _get_tokens_file() -> Path:
-    """Get the tokens file path, checking config if available."""
+# Recently validated tokens: token_id(token) -> (expires_at, user info).
+# Bounded LRU so repeat logins skip the token database; entries expire so
+# revocations made outside this process (manage_tokens.py) take effect
+# within _CACHE_TTL seconds.
+_CACHE_MAX_ENTRIES = 1024
+_CACHE_TTL = 300
+_token_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Per-thread connection to the token database: (path, connection)
+_local = threading.local()
+
+_SCHEMA = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    CREATE TABLE IF NOT EXISTS tokens (
+        token_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        callsign TEXT,
+        created TEXT NOT NULL,
+        active INTEGER NOT NULL DEFAULT 1,
+        last_used TEXT,
+        sessions_count INTEGER NOT NULL DEFAULT 0,
+        revoked TEXT
+    );
+"""
+
+_COLUMNS = "token_id, name, callsign, created, active, last_used, sessions_count, revoked"
+
+
+def token_id(token: str) -> str:
+    """
+    Get the identifier for a token.
+    
+    A SHA-256 hash, so it can be kept in cookies and caches without
+    exposing the token itself.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def invalidate_token(token: str):
+    """Drop a token from the validation cache."""
+    invalidate_user(token_id(token))
+
+
+def invalidate_user(user_id: str):
+    """Drop a token from the validation cache by its token_id."""
+    with _cache_lock:
+        _token_cache.pop(user_id, None)
+
+
+def _cache_get(user_id: str, now: float) -> dict | None:
+    """Get unexpired cached user info."""
+    with _cache_lock:
+        cached = _token_cache.get(user_id)
+        if cached and cached[0] > now:
+            _token_cache.move_to_end(user_id)
+            return cached[1]
+    return None
+
+
+def _cache_put(user_id: str, user_info: dict, now: float):
+    """Cache user info, evicting the least recently used entry when full."""
+    with _cache_lock:
+        _token_cache[user_id] = (now + _CACHE_TTL, user_info)
+        _token_cache.move_to_end(user_id)
+        if len(_token_cache) > _CACHE_MAX_ENTRIES:
+            _token_cache.popitem(last=False)
+
+
+def _get_config_path(name: str, default: str) -> Path:
+    """Get a token store path, checking config if available."""
     try:
         from app.config import Config
-        return Path(Config.TOKENS_FILE)
+        return Path(getattr(Config, name))
     except ImportError:
-        return Path(os.getenv('TOKENS_FILE', './data/tokens.json'))
+        return Path(os.getenv(name, default))
+
+
+def _connect() -> sqlite3.Connection:
+    """
+    Get this thread's connection to the token database.
+    
+    The schema is created, and a legacy tokens.json imported, the first
+    time a database is opened.
+    """
+    path = _get_config_path('TOKENS_DB', './data/tokens.db')
+    cached = getattr(_local, "db", None)
+    if cached and cached[0] == path:
+        return cached[1]
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path, isolation_level=None, timeout=5.0)
+    db.row_factory = sqlite3.Row
+    db.executescript(_SCHEMA)
+    _import_json(db, _get_config_path('TOKENS_FILE', './data/tokens.json'))
+    
+    if cached:
+        cached[1].close()
+    _local.db = (path, db)
+    return db
 
 
-def _load_tokens():
-    """Load tokens from JSON file."""
-    tokens_file = _get_tokens_file()
+def _import_json(db: sqlite3.Connection, tokens_file: Path):
+    """
+    Import tokens from a JSON tokens file, then rename it to *.imported
+    so it isn't imported again.
+    """
     if not tokens_file.exists():
-        return {"tokens": {}}
-    with open(tokens_file, 'r') as f:
-        return json.load(f)
+        return
+    
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        # Read under the write lock: another worker may have imported and
+        # renamed the file since it was seen
+        try:
+            with open(tokens_file) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = None
+        
+        if data is not None:
+            # Files from before tokens were hashed are keyed by the token itself
+            hashed = data.get("hashed", False)
+            rows = [
+                (key if hashed else token_id(key), info.get("name", ""), info.get("callsign"),
+                 info.get("created") or datetime.now().isoformat(), int(info.get("active", True)),
+                 info.get("last_used"), info.get("sessions_count", 0), info.get("revoked"))
+                for key, info in data.get("tokens", {}).items()
+            ]
+            db.executemany(f"INSERT OR IGNORE INTO tokens ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        db.execute("COMMIT")
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    
+    if data is None:
+        return
+    
+    try:
+        os.replace(tokens_file, tokens_file.with_name(tokens_file.name + ".imported"))
+    except FileNotFoundError:
+        # A worker that imported it at the same time renamed it first
+        pass
 
 
-def _save_tokens(data):
-    """Save tokens to JSON file."""
-    tokens_file = _get_tokens_file()
-    tokens_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(tokens_file, 'w') as f:
-        json.dump(data, f, indent=2)
+def _row_to_user(row) -> dict:
+    """Convert a tokens row to a user info dict."""
+    user = dict(row)
+    user["active"] = bool(user["active"])
+    return user
 
 
 def generate_token():
@@ -41,75 +177,178 @@ def generate_token():
     return secrets.token_urlsafe(16)
 
 
+def generate_tokens(n: int) -> list:
+    """
+    Generate several secure random tokens from a single urandom read.
+    
+    Each token has the same 16 bytes of entropy and format as
+    generate_token().
+    """
+    raw = os.urandom(16 * n)
+    return [
+        base64.urlsafe_b64encode(raw[i:i + 16]).rstrip(b"=").decode()
+        for i in range(0, 16 * n, 16)
+    ]
+
+
 def add_token(name: str, callsign: str = None) -> str:
     """Create a new access token for a user."""
-    data = _load_tokens()
-    token = generate_token()
+    return add_tokens([(name, callsign)])[0]
+
+
+def add_tokens(users: list) -> list:
+    """
+    Create access tokens for several users in one transaction.
+    
+    Args:
+        users: List of (name, callsign) tuples; callsign may be None
     
-    data["tokens"][token] = {
-        "name": name,
-        "callsign": callsign,
-        "created": datetime.now().isoformat(),
-        "active": True,
-        "last_used": None,
-        "sessions_count": 0
-    }
+    Returns:
+        List of new tokens, in the same order as users
+    """
+    tokens = generate_tokens(len(users))
+    created = datetime.now().isoformat()
     
-    _save_tokens(data)
-    return token
+    db = _connect()
+    db.execute("BEGIN")
+    try:
+        db.executemany(
+            "INSERT INTO tokens (token_id, name, callsign, created) VALUES (?, ?, ?, ?)",
+            [(token_id(token), name, callsign, created)
+             for token, (name, callsign) in zip(tokens, users)]
+        )
+        db.execute("COMMIT")
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    
+    return tokens
 
 
 def validate_token(token: str) -> dict | None:
     """Check if token is valid and active. Returns user info or None."""
-    data = _load_tokens()
-    token_data = data["tokens"].get(token)
+    key = token_id(token)
+    now = time.monotonic()
     
-    if token_data and token_data.get("active", False):
-        # Update last_used
-        token_data["last_used"] = datetime.now().isoformat()
-        _save_tokens(data)
-        return token_data
+    cached = _cache_get(key, now)
+    if cached is not None:
+        return cached
     
-    return None
+    row = _connect().execute(f"""
+        UPDATE tokens SET last_used = ?
+        WHERE token_id = ? AND active
+        RETURNING {_COLUMNS}
+    """, (datetime.now().isoformat(), key)).fetchone()
+    
+    if row is None:
+        return None
+    
+    user = _row_to_user(row)
+    _cache_put(key, user, now)
+    return user
+
+
+def get_user(user_id: str) -> dict | None:
+    """
+    Get the user info for an active token by its token_id.
+    
+    Served from the validation cache; only a miss (expired entry, other
+    worker process) reads the token database.
+    """
+    now = time.monotonic()
+    
+    cached = _cache_get(user_id, now)
+    if cached is not None:
+        return cached
+    
+    row = _connect().execute(
+        f"SELECT {_COLUMNS} FROM tokens WHERE token_id = ? AND active", (user_id,)
+    ).fetchone()
+    
+    if row is None:
+        return None
+    
+    user = _row_to_user(row)
+    _cache_put(user_id, user, now)
+    return user
 
 
 def increment_session_count(token: str):
     """Increment the session count for a token."""
-    data = _load_tokens()
-    if token in data["tokens"]:
-        data["tokens"][token]["sessions_count"] = data["tokens"][token].get("sessions_count", 0) + 1
-        _save_tokens(data)
+    increment_user_session_count(token_id(token))
+
+
+def increment_user_session_count(user_id: str):
+    """Increment the session count for a token by its token_id."""
+    _connect().execute(
+        "UPDATE tokens SET sessions_count = sessions_count + 1 WHERE token_id = ?",
+        (user_id,)
+    )
 
 
 def revoke_token(token: str) -> bool:
     """Deactivate a token."""
-    data = _load_tokens()
-    if token in data["tokens"]:
-        data["tokens"][token]["active"] = False
-        data["tokens"][token]["revoked"] = datetime.now().isoformat()
-        _save_tokens(data)
-        return True
-    return False
+    return revoke_user(token_id(token))
+
+
+def revoke_user(user_id: str) -> bool:
+    """Deactivate a token by its token_id."""
+    invalidate_user(user_id)
+    cursor = _connect().execute(
+        "UPDATE tokens SET active = 0, revoked = ? WHERE token_id = ?",
+        (datetime.now().isoformat(), user_id)
+    )
+    return cursor.rowcount > 0
+
+
+def _row_to_listing(row) -> dict:
+    """Convert a tokens row to a listing entry with a short token_id."""
+    return {"token_short": row["token_id"][:8] + "...", **_row_to_user(row)}
 
 
 def list_tokens() -> list:
-    """List all tokens with their info."""
-    data = _load_tokens()
-    result = []
-    for token, info in data["tokens"].items():
-        result.append({
-            "token": token,
-            "token_short": token[:8] + "...",
-            **info
-        })
-    return sorted(result, key=lambda x: x["created"], reverse=True)
+    """List all tokens with their info, identified by token_id."""
+    rows = _connect().execute(
+        f"SELECT {_COLUMNS} FROM tokens ORDER BY created DESC"
+    )
+    return [_row_to_listing(row) for row in rows]
+
+
+def find_tokens(value: str) -> list:
+    """
+    Find tokens by the full token, or by a token_id prefix as shown by
+    list_tokens.
+    
+    Args:
+        value: Token or token_id prefix
+    
+    Returns:
+        Matching listing entries; at most two for a prefix, which is
+        enough to tell a unique match from an ambiguous one
+    """
+    db = _connect()
+    row = db.execute(
+        f"SELECT {_COLUMNS} FROM tokens WHERE token_id = ?", (token_id(value),)
+    ).fetchone()
+    if row is not None:
+        return [_row_to_listing(row)]
+    
+    # Token IDs are lowercase hex, so a prefix is a range on the primary key
+    prefix = value.lower()
+    rows = db.execute(
+        f"SELECT {_COLUMNS} FROM tokens WHERE token_id >= ? AND token_id < ? LIMIT 2",
+        (prefix, prefix + "\uffff")
+    )
+    return [_row_to_listing(row) for row in rows]
 
 
 def delete_token(token: str) -> bool:
     """Permanently delete a token."""
-    data = _load_tokens()
-    if token in data["tokens"]:
-        del data["tokens"][token]
-        _save_tokens(data)
-        return True
-    return False
+    return delete_user(token_id(token))
+
+
+def delete_user(user_id: str) -> bool:
+    """Permanently delete a token by its token_id."""
+    invalidate_user(user_id)
+    cursor = _connect().execute("DELETE FROM tokens WHERE token_id = ?", (user_id,))
+    return cursor.rowcount > 0
@@ -5,16 +5,204 @@ Supports voice quality presets with cost tracking.
 
 import hashlib
 import os
-from typing import Optional, Tuple
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from google.cloud import texttospeech
 from app.config import Config
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+
+# Cache directories already created in this process
+_INITIALIZED_DIRS = set()
+_dirs_lock = threading.Lock()
+
+# Cache keys known to be on disk, per cache directory. Filled from one
+# directory scan on first use, so cache hits skip the stat() call. Files
+# deleted out of band (by hand, or clear_cache in another process) stay
+# known until something finds them missing: joining segments, or the
+# audio route answering 404, drops the key via forget_cached() so the
+# next synthesize() of that text makes the file again.
+_KNOWN_KEYS = {}
+_known_keys_lock = threading.Lock()
+
+# One Google client (and gRPC channel) shared by every TTSClient;
+# created on first use
+_speech_client = None
+_speech_client_lock = threading.Lock()
+
+# Runs the API calls of synthesize_many side by side
+_batch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tts-batch")
+
+# Subdirectory of the cache holding audio stored by content hash; the
+# per-text cache files are hard links into it
+_BLOB_DIR = ".blobs"
+
+# Subdirectory of lock files that stop two processes synthesizing the same
+# text at once; keys are striped over _LOCK_STRIPES files so the number of
+# lock files stays fixed
+_LOCK_DIR = ".locks"
+_LOCK_STRIPES = 256
+
+# Age after which clear_cache treats a temporary file as abandoned
+_STALE_TMP_SECONDS = 300
+
+
+def _ensure_cache_dir(path: str):
+    """Create a cache directory once per process."""
+    if path in _INITIALIZED_DIRS:
+        return
+    
+    with _dirs_lock:
+        if path not in _INITIALIZED_DIRS:
+            os.makedirs(path, exist_ok=True)
+            _INITIALIZED_DIRS.add(path)
+
+
+def _write_atomic(path: str, data: bytes):
+    """
+    Write a file under a temporary name and rename it into place, so
+    concurrent readers never see it partially written.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Missing-ok so a failed cleanup can't hide the original error
+        _unlink_missing_ok(tmp_path)
+        raise
+
+
+@lru_cache(maxsize=1024)
+def _cache_key_for(text: str, voice_key: bytes) -> str:
+    """
+    Get the cache key for text spoken with a voice.
+    
+    Memoized because greetings and fixed prompt segments repeat across
+    sessions; a repeat skips encoding and hashing the text.
+    
+    Args:
+        text: Text to be spoken
+        voice_key: Everything besides the text that changes the audio
+    
+    Returns:
+        Hex cache key
+    """
+    digest = hashlib.blake2b(text.encode(), digest_size=16)
+    digest.update(voice_key)
+    return digest.hexdigest()
+
+
+def _unlink_missing_ok(path: str):
+    """Delete a file, ignoring it if it's already gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+@contextmanager
+def _synthesis_lock(cache_dir: str, cache_key: str):
+    """
+    Hold an exclusive lock, shared across processes, for synthesizing a
+    cache key.
+    
+    Does nothing where fcntl isn't available.
+    """
+    if fcntl is None:
+        yield
+        return
+    
+    lock_dir = os.path.join(cache_dir, _LOCK_DIR)
+    lock_path = os.path.join(lock_dir, f"{int(cache_key[:4], 16) % _LOCK_STRIPES:02x}.lock")
+    _ensure_cache_dir(lock_dir)
+    try:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    except FileNotFoundError:
+        # Directory removed since it was created
+        with _dirs_lock:
+            _INITIALIZED_DIRS.discard(lock_dir)
+        _ensure_cache_dir(lock_dir)
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def _known_keys(cache_dir: str) -> set:
+    """Get the set of cache keys known to exist in a cache directory."""
+    keys = _KNOWN_KEYS.get(cache_dir)
+    if keys is None:
+        with _known_keys_lock:
+            keys = _KNOWN_KEYS.get(cache_dir)
+            if keys is None:
+                keys = set()
+                try:
+                    with os.scandir(cache_dir) as entries:
+                        keys.update(entry.name[:-4] for entry in entries
+                                    if entry.name.endswith(".mp3"))
+                except FileNotFoundError:
+                    pass
+                _KNOWN_KEYS[cache_dir] = keys
+    return keys
+
+
+def forget_cached(cache_dir: str, cache_key: str):
+    """
+    Drop a cache key whose file was found missing from disk.
+    
+    Args:
+        cache_dir: Cache directory the key belongs to
+        cache_key: Cache key (audio file name without .mp3)
+    """
+    keys = _KNOWN_KEYS.get(cache_dir)
+    if keys is not None:
+        keys.discard(cache_key)
+
+
+def _get_speech_client() -> texttospeech.TextToSpeechClient:
+    """Get the shared Google Text-to-Speech client, creating it once."""
+    global _speech_client
+    if _speech_client is None:
+        with _speech_client_lock:
+            if _speech_client is None:
+                _speech_client = texttospeech.TextToSpeechClient()
+    return _speech_client
+
+
+def warm_up():
+    """
+    Open the shared client's channel before the first synthesis needs it.
+    
+    Failures are ignored here; synthesize() raises them if they persist.
+    """
+    try:
+        _get_speech_client().list_voices(language_code=Config.TTS_LANGUAGE_CODE)
+    except Exception:
+        pass
+
 
 class TTSClient:
     """Client for Google Cloud Text-to-Speech API with voice quality selection."""
     
     def __init__(self, voice_preset: str = "premium_female", speech_rate: float = 1.0,
-                 language_code: Optional[str] = None, cache_dir: Optional[str] = None):
+                 language_code: Optional[str] = None, cache_dir: Optional[str] = None,
+                 preload: bool = True):
         """
         Initialize the TTS client.
         
@@ -23,9 +211,10 @@ class TTSClient:
             speech_rate: Speaking rate multiplier. Defaults to 1.0.
             language_code: Language code. Defaults to config value.
             cache_dir: Directory for caching audio files.
+            preload: Scan the cache directory now, so the first synthesis
+                doesn't pay for it. One-shot scripts over a large cache can
+                pass False to scan only if a lookup needs it.
         """
-        from app.config import Config
-        
         preset = Config.VOICE_PRESETS.get(voice_preset, Config.VOICE_PRESETS["premium_female"])
         self.voice_name = preset["name"]
         self.supports_rate = preset["supports_rate"]
@@ -35,11 +224,36 @@ class TTSClient:
         self.language_code = language_code or Config.TTS_LANGUAGE_CODE
         self.cache_dir = cache_dir or Config.AUDIO_CACHE_DIR
         
-        # Initialize client
-        self.client = texttospeech.TextToSpeechClient()
+        # Everything besides the text that changes the audio, hashed into
+        # each cache key
+        self._voice_key = f":{self.voice_name}:{self.speech_rate}".encode()
+        
+        # Request settings are fixed per client, so build them once
+        self._voice = texttospeech.VoiceSelectionParams(
+            language_code=self.language_code,
+            name=self.voice_name
+        )
+        
+        # Only include speaking_rate if supported
+        if self.speech_rate is not None:
+            self._audio_config = texttospeech.AudioConfig(
+                audio_encoding=texttospeech.AudioEncoding.MP3,
+                speaking_rate=self.speech_rate
+            )
+        else:
+            self._audio_config = texttospeech.AudioConfig(
+                audio_encoding=texttospeech.AudioEncoding.MP3
+            )
+        
+        # Shared client: channel setup is paid once per process
+        self.client = _get_speech_client()
         
         # Ensure cache directory exists
-        os.makedirs(self.cache_dir, exist_ok=True)
+        _ensure_cache_dir(self.cache_dir)
+        
+        # Scanned once per directory per process; later clients reuse it
+        if preload:
+            _known_keys(self.cache_dir)
     
     def synthesize(self, text: str) -> Tuple[str, int]:
         """
@@ -54,45 +268,148 @@ class TTSClient:
         """
         char_count = len(text)
         
-        # Generate cache key from text content AND voice name
-        cache_key = hashlib.md5(f"{text}:{self.voice_name}".encode()).hexdigest()
-        cache_path = os.path.join(self.cache_dir, f"{cache_key}.mp3")
+        cache_key = self._cache_key(text)
         
         # Return cached if exists
-        if os.path.exists(cache_path):
+        if self._is_cached(cache_key):
             return f"/audio/{cache_key}.mp3", char_count
         
-        # Synthesize
-        synthesis_input = texttospeech.SynthesisInput(text=text)
+        # Synthesize, one caller at a time per key across processes, so
+        # concurrent requests for the same text make one API call
+        with _synthesis_lock(self.cache_dir, cache_key):
+            if not self._is_cached(cache_key):
+                response = self.client.synthesize_speech(
+                    input=texttospeech.SynthesisInput(text=text),
+                    voice=self._voice,
+                    audio_config=self._audio_config
+                )
+                self._write_cache(cache_key, response.audio_content)
         
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=self.language_code,
-            name=self.voice_name
-        )
+        return f"/audio/{cache_key}.mp3", char_count
+    
+    def synthesize_many(self, texts: List[str]) -> List[Tuple[str, int]]:
+        """
+        Convert several texts to speech, making the API calls concurrently.
         
-        # Build audio config - only include speaking_rate if supported
-        if self.speech_rate is not None:
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
-                speaking_rate=self.speech_rate
-            )
-        else:
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3
-            )
+        Cached texts are answered directly; each distinct uncached text is
+        synthesized once, with the requests in flight together so the
+        batch pays roughly one round trip instead of one per text.
         
-        response = self.client.synthesize_speech(
-            input=synthesis_input,
-            voice=voice,
-            audio_config=audio_config
-        )
+        Args:
+            texts: Texts to convert to speech
         
-        # Save to cache
-        with open(cache_path, "wb") as f:
-            f.write(response.audio_content)
+        Returns:
+            List of (URL path to audio file, character count), in the
+            same order as texts
+        """
+        missing = {text for text in texts if not self._is_cached(self._cache_key(text))}
+        
+        if len(missing) > 1:
+            # The gRPC client is thread-safe; results land in the cache
+            list(_batch_pool.map(self.synthesize, missing))
+        
+        return [self.synthesize(text) for text in texts]
+    
+    def synthesize_joined(self, segments: list) -> Tuple[str, int]:
+        """
+        Convert text to speech one segment at a time and join the audio.
+        
+        Each segment goes through synthesize() and its cache, so segments
+        shared between texts (fixed parts of a template) are only sent to
+        the API once. MP3 frames concatenate cleanly, so the joined file
+        is the segments' files back to back.
+        
+        Args:
+            segments: Text segments, in order, that make up the full text
+        
+        Returns:
+            Tuple of (URL path to the joined audio file, character count)
+        """
+        text = "".join(segments)
+        char_count = len(text)
+        
+        cache_key = self._cache_key(text)
+        
+        if not self._is_cached(cache_key):
+            texts = [segment.strip() for segment in segments]
+            parts = [
+                self._read_audio(segment_text, url)
+                for segment_text, (url, _) in zip(texts, self.synthesize_many(texts))
+            ]
+            self._write_cache(cache_key, b"".join(parts))
         
         return f"/audio/{cache_key}.mp3", char_count
     
+    def _read_audio(self, text: str, url: str) -> bytes:
+        """
+        Read a synthesized file, making it again if it was deleted since
+        it was cached.
+        """
+        try:
+            with open(self.get_audio_path(url), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            forget_cached(self.cache_dir, url.split("/")[-1][:-4])
+            url, _ = self.synthesize(text)
+            with open(self.get_audio_path(url), "rb") as f:
+                return f.read()
+    
+    def _is_cached(self, cache_key: str) -> bool:
+        """Check whether audio for a cache key is on disk."""
+        known = _known_keys(self.cache_dir)
+        if cache_key in known:
+            return True
+        
+        # Possibly written by another process since the directory scan
+        if os.path.exists(os.path.join(self.cache_dir, f"{cache_key}.mp3")):
+            known.add(cache_key)
+            return True
+        return False
+    
+    def _write_cache(self, cache_key: str, audio: bytes):
+        """
+        Save audio to the cache.
+        
+        The bytes are stored once per distinct audio under .blobs/, named
+        by their hash, and the cache file is made a hard link to that file.
+        Identical audio shares one file, and the cache file only ever
+        appears fully written.
+        """
+        cache_path = os.path.join(self.cache_dir, f"{cache_key}.mp3")
+        blob_dir = os.path.join(self.cache_dir, _BLOB_DIR)
+        blob_name = hashlib.blake2b(audio, digest_size=16).hexdigest() + ".mp3"
+        blob_path = os.path.join(blob_dir, blob_name)
+        
+        if not os.path.exists(blob_path):
+            # Recreate the directories if they were removed since
+            try:
+                _write_atomic(blob_path, audio)
+            except FileNotFoundError:
+                with _dirs_lock:
+                    _INITIALIZED_DIRS.discard(blob_dir)
+                _ensure_cache_dir(blob_dir)
+                _write_atomic(blob_path, audio)
+        
+        try:
+            os.link(blob_path, cache_path)
+        except FileExistsError:
+            # Another thread cached the same text first
+            pass
+        except OSError:
+            # Filesystem without hard links
+            _write_atomic(cache_path, audio)
+        
+        _known_keys(self.cache_dir).add(cache_key)
+    
+    def _cache_key(self, text: str) -> str:
+        """
+        Get the cache key for text spoken with this client's voice and rate.
+        
+        BLAKE2b with a 16-byte digest keeps keys the length of the old MD5
+        keys while hashing faster.
+        """
+        return _cache_key_for(text, self._voice_key)
+    
     def calculate_cost(self, char_count: int) -> float:
         """
         Calculate cost for synthesizing text.
@@ -123,11 +440,34 @@ class TTSClient:
         Clear all cached audio files.
         
         Returns:
-            Number of files deleted
+            Number of files deleted (not counting the shared audio blobs)
         """
-        count = 0
-        for filename in os.listdir(self.cache_dir):
-            if filename.endswith(".mp3"):
-                os.remove(os.path.join(self.cache_dir, filename))
-                count += 1
+        audio_paths = []
+        stale_before = time.time() - _STALE_TMP_SECONDS
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                # DirEntry caches the file type, so this costs no extra stat
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.name.endswith(".mp3"):
+                    audio_paths.append(entry.path)
+                elif entry.name.endswith(".tmp") and entry.stat().st_mtime < stale_before:
+                    # Left behind by a write interrupted mid-way; newer ones
+                    # may belong to a write still in progress
+                    _unlink_missing_ok(entry.path)
+        
+        # unlink() releases the GIL, so a large cache clears faster with
+        # the calls spread over the batch threads
+        list(_batch_pool.map(_unlink_missing_ok, audio_paths))
+        count = len(audio_paths)
+        
+        with _dirs_lock:
+            for name in (_BLOB_DIR, _LOCK_DIR):
+                path = os.path.join(self.cache_dir, name)
+                shutil.rmtree(path, ignore_errors=True)
+                _INITIALIZED_DIRS.discard(path)
+        
+        with _known_keys_lock:
+            _KNOWN_KEYS.pop(self.cache_dir, None)
+        
         return count
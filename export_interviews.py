@@ -3,57 +3,105 @@
 
 import json
 import sqlite3
+import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional, see requirements.txt
+    orjson = None
+
 DATABASE = Path('./data/interviews.db')
 EXPORT_DIR = Path('./data/exports')
 
+# Read-heavy settings for a long export run: map up to 1 GB of the
+# database and keep a 64 MB page cache
+_EXPORT_PRAGMAS = """
+    PRAGMA cache_size=-64000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=1073741824;
+"""
 
-def export_session(session_id: str, output_dir: Path):
-    """Export a single session with all messages and extractions."""
-    if not DATABASE.exists():
-        print(f"Database not found at {DATABASE}")
-        return None
+
+def _open_ro() -> sqlite3.Connection:
+    """
+    Open the interviews database read-only.
     
-    conn = sqlite3.connect(DATABASE)
+    The app keeps the database in WAL mode, so these reads run alongside a
+    live server without blocking it. A read-only connection can't change the
+    journal mode, so it is left to the app.
+    """
+    conn = sqlite3.connect(f"{DATABASE.resolve().as_uri()}?mode=ro", uri=True)
     conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    conn.executescript(_EXPORT_PRAGMAS)
+    return conn
+
+
+def export_session(session_id: str, output_dir: Path, conn: sqlite3.Connection = None):
+    """
+    Export a single session with all messages and extractions.
+    
+    Args:
+        session_id: Session to export
+        output_dir: Directory to write the JSON file to
+        conn: Open connection to reuse; one is opened and closed if omitted
+    
+    Returns:
+        Path of the written file, or None if the session wasn't exported
+    """
+    if conn is None:
+        if not DATABASE.exists():
+            print(f"Database not found at {DATABASE}")
+            return None
+        conn = _open_ro()
+        try:
+            return export_session(session_id, output_dir, conn)
+        finally:
+            conn.close()
     
     # Get session info
-    cursor.execute("SELECT * FROM sessions WHERE id = ?", (session_id,))
-    session = cursor.fetchone()
+    session = conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,)).fetchone()
     
     if not session:
         print(f"Session {session_id} not found")
-        conn.close()
         return None
     
-    session = dict(session)
-    
-    # Get messages
-    cursor.execute(
+    messages = conn.execute(
         "SELECT role, content, created_at FROM messages WHERE session_id = ? ORDER BY created_at",
         (session_id,)
     )
-    messages = [dict(row) for row in cursor.fetchall()]
-    
-    # Get extractions
-    cursor.execute(
+    extractions = conn.execute(
         "SELECT extraction_data, message_range_start, message_range_end, created_at FROM extractions WHERE session_id = ?",
         (session_id,)
     )
-    extractions = []
-    for row in cursor.fetchall():
-        ext = dict(row)
-        ext['extraction_data'] = json.loads(ext['extraction_data']) if ext['extraction_data'] else None
-        extractions.append(ext)
-    
-    conn.close()
     
-    # Build export object
-    export = {
+    export = _build_export(
+        dict(session),
+        [dict(row) for row in messages],
+        [_decode_extraction(dict(row)) for row in extractions]
+    )
+    return _write_export(export, output_dir)
+
+
+def _decode_extraction(ext: dict) -> dict:
+    """Parse an extraction row's stored JSON."""
+    data = ext['extraction_data']
+    if data:
+        ext['extraction_data'] = orjson.loads(data) if orjson else json.loads(data)
+    else:
+        ext['extraction_data'] = None
+    return ext
+
+
+def _build_export(session: dict, messages: list, extractions: list) -> dict:
+    """Build the export object for one session."""
+    return {
         "export_date": datetime.now().isoformat(),
         "session": {
             "id": session["id"],
@@ -73,42 +121,159 @@ def export_session(session_id: str, output_dir: Path):
         "messages": messages,
         "extractions": extractions
     }
-    
-    # Write to file
+
+
+def _write_export(export: dict, output_dir: Path) -> Path:
+    """Write an export object to its file in output_dir."""
+    session = export["session"]
     output_dir.mkdir(parents=True, exist_ok=True)
     expert_name = (session['expert_name'] or 'Unknown').replace(' ', '_')
     filename = f"{expert_name}_{session['id'][:8]}.json"
     filepath = output_dir / filename
     
-    with open(filepath, 'w') as f:
-        json.dump(export, f, indent=2)
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(export, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(export, f, indent=2)
     
     print(f"✅ Exported: {filepath}")
     return filepath
 
 
-def export_all(output_dir: Path):
-    """Export all completed sessions."""
-    if not DATABASE.exists():
-        print(f"Database not found at {DATABASE}")
-        return
+def _grouped_by_session(cursor):
+    """Yield (session_id, rows) from a cursor ordered by session_id."""
+    for session_id, rows in groupby(cursor, key=itemgetter("session_id")):
+        group = []
+        for row in rows:
+            row = dict(row)
+            del row["session_id"]
+            group.append(row)
+        yield session_id, group
+
+
+def _take_group(groups, current: tuple, session_id: str):
+    """
+    Take the rows for session_id from a grouped stream.
     
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    Args:
+        groups: Iterator from _grouped_by_session
+        current: The (session_id, rows) group the stream is positioned on
+        session_id: Session being exported
     
-    cursor.execute("SELECT id, expert_name FROM sessions WHERE status = 'completed'")
-    sessions = cursor.fetchall()
-    conn.close()
+    Returns:
+        Tuple of (rows for the session, group the stream is now positioned on)
+    """
+    if current[0] != session_id:
+        return [], current
+    return current[1], next(groups, (None, []))
+
+
+# Connection used by each export_all worker process
+_worker_conn = None
+
+
+def _init_worker():
+    """Open a worker process's own database connection."""
+    global _worker_conn
+    _worker_conn = _open_ro()
+
+
+def _export_in_worker(session_id: str, output_dir: Path):
+    """Export one session from a worker process."""
+    return export_session(session_id, output_dir, _worker_conn)
+
+
+def _export_parallel(output_dir: Path, jobs: int):
+    """Export all completed sessions across jobs worker processes."""
+    conn = _open_ro()
+    try:
+        session_ids = [row["id"] for row in conn.execute(
+            "SELECT id FROM sessions WHERE status = 'completed' ORDER BY id"
+        )]
+    finally:
+        conn.close()
     
-    if not sessions:
+    if not session_ids:
         print("No completed sessions to export.")
         return
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    for session in sessions:
-        export_session(session["id"], output_dir)
+    # Each session is written to its own file, so workers need no coordination
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        list(pool.map(partial(_export_in_worker, output_dir=output_dir), session_ids,
+                      chunksize=8))
+
+
+def export_all(output_dir: Path, jobs: int = 1):
+    """
+    Export all completed sessions.
+    
+    Sessions, messages and extractions are each read with one query,
+    ordered by session, and grouped as the rows stream in, rather than
+    querying every session separately.
+    
+    Args:
+        output_dir: Directory to write the JSON files to
+        jobs: Worker processes to export with; above 1, each worker
+            queries and serializes its share of the sessions separately
+    """
+    if not DATABASE.exists():
+        print(f"Database not found at {DATABASE}")
+        return
+    
+    if jobs > 1:
+        _export_parallel(output_dir, jobs)
+        return
+    
+    # One connection for the whole run instead of one per session
+    conn = _open_ro()
+    try:
+        sessions = conn.execute(
+            "SELECT * FROM sessions WHERE status = 'completed' ORDER BY id"
+        )
+        # Messages and extractions are separate queries because joining both
+        # onto sessions would repeat every message once per extraction
+        message_groups = _grouped_by_session(conn.execute("""
+            SELECT m.session_id, m.role, m.content, m.created_at
+            FROM messages m JOIN sessions s ON s.id = m.session_id
+            WHERE s.status = 'completed'
+            ORDER BY m.session_id, m.created_at
+        """))
+        extraction_groups = _grouped_by_session(conn.execute("""
+            SELECT e.session_id, e.extraction_data, e.message_range_start,
+                   e.message_range_end, e.created_at
+            FROM extractions e JOIN sessions s ON s.id = e.session_id
+            WHERE s.status = 'completed'
+            ORDER BY e.session_id, e.created_at
+        """))
+        
+        next_messages = next(message_groups, (None, []))
+        next_extractions = next(extraction_groups, (None, []))
+        exported = 0
+        
+        for session in sessions:
+            session = dict(session)
+            messages, next_messages = _take_group(message_groups, next_messages, session["id"])
+            extractions, next_extractions = _take_group(
+                extraction_groups, next_extractions, session["id"]
+            )
+            
+            export = _build_export(
+                session, messages, [_decode_extraction(ext) for ext in extractions]
+            )
+            _write_export(export, output_dir)
+            exported += 1
+        
+        if not exported:
+            print("No completed sessions to export.")
+    finally:
+        conn.close()
+
+
+_SESSION_ROW = "{expert:<20} {callsign:<10} {interviewer:<15} {status:<12} {messages:<10} {cost:<8} {date:<12}\n"
 
 
 def list_sessions():
@@ -117,8 +282,7 @@ def list_sessions():
         print(f"\nDatabase not found at {DATABASE}\n")
         return
     
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row
+    conn = _open_ro()
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -134,21 +298,27 @@ def list_sessions():
         print("\nNo sessions found.\n")
         return
     
-    print(f"\n{'Expert':<20} {'Callsign':<10} {'Interviewer':<15} {'Status':<12} {'Messages':<10} {'Cost':<8} {'Date':<12}")
-    print("-" * 97)
+    row = _SESSION_ROW.format
+    lines = [
+        "\n" + row(expert="Expert", callsign="Callsign", interviewer="Interviewer",
+                   status="Status", messages="Messages", cost="Cost", date="Date"),
+        "-" * 97 + "\n",
+    ]
     
     for s in sessions:
-        expert = (s["expert_name"] or "Unknown")[:20]
-        callsign = (s["expert_callsign"] or "-")[:10]
-        interviewer = (s["token_user_name"] or "-")[:15]
-        status = (s["status"] or "unknown")[:12]
-        messages = s["message_count"] or 0
-        cost = f"${s['estimated_cost'] or 0:.2f}"
-        date = (s["created_at"] or "")[:10]
-        
-        print(f"{expert:<20} {callsign:<10} {interviewer:<15} {status:<12} {messages:<10} {cost:<8} {date:<12}")
+        lines.append(row(
+            expert=(s["expert_name"] or "Unknown")[:20],
+            callsign=(s["expert_callsign"] or "-")[:10],
+            interviewer=(s["token_user_name"] or "-")[:15],
+            status=(s["status"] or "unknown")[:12],
+            messages=s["message_count"] or 0,
+            cost=f"${s['estimated_cost'] or 0:.2f}",
+            date=(s["created_at"] or "")[:10]
+        ))
     
-    print()
+    # One write for the whole table instead of one per row
+    lines.append("\n")
+    sys.stdout.write("".join(lines))
 
 
 def main():
@@ -168,7 +338,9 @@ def main():
     # Export all command
     all_parser = subparsers.add_parser("all", help="Export all completed sessions")
     all_parser.add_argument("--output", "-o", default="./data/exports", help="Output directory")
-    all_parser.set_defaults(func=lambda args: export_all(Path(args.output)))
+    all_parser.add_argument("--jobs", "-j", type=int, default=1,
+                            help="Worker processes, for large exports")
+    all_parser.set_defaults(func=lambda args: export_all(Path(args.output), args.jobs))
     
     args = parser.parse_args()
     
@@ -2,87 +2,11 @@
 """CLI tool for managing access tokens."""
 
 import sys
-import os
-import json
-import secrets
 import argparse
-from datetime import datetime
-from pathlib import Path
 
-# Standalone token functions to avoid importing the full app
-TOKENS_FILE = Path(os.getenv('TOKENS_FILE', './data/tokens.json'))
-
-
-def _load_tokens():
-    """Load tokens from JSON file."""
-    if not TOKENS_FILE.exists():
-        return {"tokens": {}}
-    with open(TOKENS_FILE, 'r') as f:
-        return json.load(f)
-
-
-def _save_tokens(data):
-    """Save tokens to JSON file."""
-    TOKENS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(TOKENS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
-
-
-def generate_token():
-    """Generate a secure random token."""
-    return secrets.token_urlsafe(16)
-
-
-def add_token(name: str, callsign: str = None) -> str:
-    """Create a new access token for a user."""
-    data = _load_tokens()
-    token = generate_token()
-    
-    data["tokens"][token] = {
-        "name": name,
-        "callsign": callsign,
-        "created": datetime.now().isoformat(),
-        "active": True,
-        "last_used": None,
-        "sessions_count": 0
-    }
-    
-    _save_tokens(data)
-    return token
-
-
-def revoke_token(token: str) -> bool:
-    """Deactivate a token."""
-    data = _load_tokens()
-    if token in data["tokens"]:
-        data["tokens"][token]["active"] = False
-        data["tokens"][token]["revoked"] = datetime.now().isoformat()
-        _save_tokens(data)
-        return True
-    return False
-
-
-def list_tokens() -> list:
-    """List all tokens with their info."""
-    data = _load_tokens()
-    result = []
-    for token, info in data["tokens"].items():
-        result.append({
-            "token": token,
-            "token_short": token[:8] + "...",
-            **info
-        })
-    return sorted(result, key=lambda x: x["created"], reverse=True)
-
-
-def delete_token(token: str) -> bool:
-    """Permanently delete a token."""
-    data = _load_tokens()
-    if token in data["tokens"]:
-        del data["tokens"][token]
-        _save_tokens(data)
-        return True
-    return False
+from app.services.token_manager import (
+    add_token, delete_user, find_tokens, list_tokens, revoke_user
+)
 
 
 def cmd_add(args):
@@ -92,9 +16,13 @@ def cmd_add(args):
     if args.callsign:
         print(f"   Callsign: {args.callsign}")
     print(f"\n   Token: {token}")
+    print("   (Only a hash is stored - copy the token now, it cannot be shown again.)")
     print(f"\n   Give this token to {args.name.split()[0]} - they'll need it to access the system.\n")
 
 
+_TOKEN_ROW = "{name:<25} {callsign:<10} {status:<10} {sessions:<10} {last_used:<20} {token_id:<12}\n"
+
+
 def cmd_list(args):
     """List all tokens."""
     tokens = list_tokens()
@@ -103,27 +31,33 @@ def cmd_list(args):
         print("\nNo tokens found.\n")
         return
     
-    print(f"\n{'Name':<25} {'Callsign':<10} {'Status':<10} {'Sessions':<10} {'Last Used':<20} {'Token':<12}")
-    print("-" * 97)
+    row = _TOKEN_ROW.format
+    lines = [
+        "\n" + row(name="Name", callsign="Callsign", status="Status", sessions="Sessions",
+                   last_used="Last Used", token_id="Token ID"),
+        "-" * 97 + "\n",
+    ]
     
     for t in tokens:
-        status = "✅ Active" if t["active"] else "❌ Revoked"
-        last_used = t.get("last_used") or "Never"
-        if last_used != "Never":
-            last_used = last_used[:16].replace("T", " ")
-        callsign = t.get("callsign") or "-"
-        sessions = t.get("sessions_count", 0)
-        
-        print(f"{t['name']:<25} {callsign:<10} {status:<10} {sessions:<10} {last_used:<20} {t['token_short']:<12}")
+        last_used = t.get("last_used")
+        lines.append(row(
+            name=t["name"],
+            callsign=t.get("callsign") or "-",
+            status="✅ Active" if t["active"] else "❌ Revoked",
+            sessions=t.get("sessions_count", 0),
+            last_used=last_used[:16].replace("T", " ") if last_used else "Never",
+            token_id=t["token_short"]
+        ))
     
-    print()
+    # One write for the whole table instead of one per row
+    lines.append("\n")
+    sys.stdout.write("".join(lines))
 
 
 def cmd_revoke(args):
     """Revoke a token."""
-    # Allow partial token match
-    tokens = list_tokens()
-    matches = [t for t in tokens if t["token"].startswith(args.token)]
+    # Allow the full token or a token ID prefix
+    matches = find_tokens(args.token)
     
     if len(matches) == 0:
         print(f"\n❌ No token found starting with '{args.token}'\n")
@@ -133,7 +67,7 @@ def cmd_revoke(args):
         return
     
     token = matches[0]
-    if revoke_token(token["token"]):
+    if revoke_user(token["token_id"]):
         print(f"\n✅ Token revoked for {token['name']}")
         print(f"   They will no longer be able to access the system.\n")
     else:
@@ -142,8 +76,7 @@ def cmd_revoke(args):
 
 def cmd_delete(args):
     """Permanently delete a token."""
-    tokens = list_tokens()
-    matches = [t for t in tokens if t["token"].startswith(args.token)]
+    matches = find_tokens(args.token)
     
     if len(matches) == 0:
         print(f"\n❌ No token found starting with '{args.token}'\n")
@@ -155,7 +88,7 @@ def cmd_delete(args):
     token = matches[0]
     confirm = input(f"Permanently delete token for {token['name']}? (yes/no): ")
     if confirm.lower() == 'yes':
-        if delete_token(token["token"]):
+        if delete_user(token["token_id"]):
             print(f"\n✅ Token permanently deleted.\n")
         else:
             print(f"\n❌ Failed to delete token.\n")
@@ -179,12 +112,12 @@ def main():
     
     # Revoke command
     revoke_parser = subparsers.add_parser("revoke", help="Revoke a token (user can't login)")
-    revoke_parser.add_argument("token", help="Token or token prefix to revoke")
+    revoke_parser.add_argument("token", help="Token, or token ID prefix from list, to revoke")
     revoke_parser.set_defaults(func=cmd_revoke)
     
     # Delete command
     delete_parser = subparsers.add_parser("delete", help="Permanently delete a token")
-    delete_parser.add_argument("token", help="Token or token prefix to delete")
+    delete_parser.add_argument("token", help="Token, or token ID prefix from list, to delete")
     delete_parser.set_defaults(func=cmd_delete)
     
     args = parser.parse_args()
@@ -22,6 +22,11 @@ class InterviewController {
         this.speechRate = 0.95;
         this.sessionCost = 0;
         
+        // Sentence audio queued while a streamed response is arriving
+        this.audioQueue = [];
+        this.streaming = false;
+        this.audioSkipped = false;
+        
         // Recording timer
         this.recordingStartTime = null;
         this.recordingTimer = null;
@@ -145,12 +150,12 @@ class InterviewController {
         
         // Audio player events
         this.audioPlayer.addEventListener('ended', () => {
-            this.setState('idle');
+            this.playNextAudio();
         });
         
         this.audioPlayer.addEventListener('error', (e) => {
             console.error('Audio playback error:', e);
-            this.setState('idle');
+            this.playNextAudio();
         });
         
         // Enter key to start session
@@ -461,7 +466,7 @@ class InterviewController {
         this.transcript = '';
         
         try {
-            const response = await fetch('/api/interview', {
+            const response = await fetch('/api/interview/stream', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
@@ -475,7 +480,24 @@ class InterviewController {
                 throw new Error(error.error || 'Failed to get response');
             }
             
-            const data = await response.json();
+            this.streaming = true;
+            this.audioQueue = [];
+            this.audioSkipped = false;
+            
+            // Show and play each sentence as soon as it arrives
+            let responseText = '';
+            let textEl = null;
+            const data = await this.readEvents(response, (event) => {
+                responseText = responseText ? `${responseText} ${event.text}` : event.text;
+                if (textEl) {
+                    textEl.textContent = responseText;
+                } else {
+                    textEl = this.addMessage('assistant', responseText);
+                }
+                this.queueAudio(event.audio_url);
+            });
+            
+            this.streaming = false;
             
             // Update cost tracking
             if (data.session_cost !== undefined) {
@@ -483,22 +505,22 @@ class InterviewController {
                 this.updateCostDisplay();
             }
             
-            // Add response message
-            this.addMessage('assistant', data.response_text);
+            if (!textEl) {
+                this.addMessage('assistant', data.response_text);
+            }
             this.updateMessageCount(data.message_count);
             
             if (data.extraction_triggered) {
                 console.log('Knowledge extraction triggered');
             }
             
-            // Play response audio
-            if (data.audio_url) {
-                this.playAudio(data.audio_url);
-            } else {
+            // Nothing left to play
+            if (this.state === 'sending') {
                 this.setState('idle');
             }
             
         } catch (error) {
+            this.streaming = false;
             console.error('Failed to send message:', error);
             this.addMessage('system', 'Error: ' + error.message);
             this.setStatus('error', '❌ Failed to send. Please try again.');
@@ -509,6 +531,41 @@ class InterviewController {
         }
     }
     
+    /**
+     * Read Server-Sent Events from a streamed interview response
+     * Calls onSentence for each sentence event and returns the final 'done' event
+     */
+    async readEvents(response, onSentence) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let result = null;
+        
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            
+            buffer += decoder.decode(value, { stream: true });
+            const chunks = buffer.split('\n\n');
+            buffer = chunks.pop();
+            
+            for (const chunk of chunks) {
+                if (!chunk.startsWith('data: ')) continue;
+                
+                const event = JSON.parse(chunk.slice(6));
+                if (event.type === 'error') throw new Error(event.error);
+                if (event.type === 'done') {
+                    result = event;
+                } else {
+                    onSentence(event);
+                }
+            }
+        }
+        
+        if (!result) throw new Error('Response ended unexpectedly');
+        return result;
+    }
+    
     /**
      * Update the session cost display
      */
@@ -536,10 +593,39 @@ class InterviewController {
         });
     }
     
+    /**
+     * Play a sentence now, or after the one currently playing
+     */
+    queueAudio(url) {
+        if (!url || this.audioSkipped) return;
+        
+        if (this.state === 'playing') {
+            this.audioQueue.push(url);
+        } else {
+            this.playAudio(url);
+        }
+    }
+    
+    /**
+     * Continue with the next queued sentence once playback ends
+     */
+    playNextAudio() {
+        const next = this.audioQueue.shift();
+        if (next) {
+            this.playAudio(next);
+        } else if (this.streaming) {
+            this.setState('sending');
+        } else {
+            this.setState('idle');
+        }
+    }
+    
     /**
      * Skip audio playback
      */
     skipAudio() {
+        this.audioQueue = [];
+        this.audioSkipped = true;
         this.audioPlayer.pause();
         this.audioPlayer.currentTime = 0;
         this.setState('idle');
@@ -585,6 +671,8 @@ class InterviewController {
         
         chatMessages.appendChild(messageDiv);
         chatMessages.scrollTop = chatMessages.scrollHeight;
+        
+        return messageDiv.querySelector('.message-text');
     }
     
     /**
@@ -17,3 +17,15 @@ def mock_config(monkeypatch):
     monkeypatch.setenv('GOOGLE_API_KEY', 'test-google-key')
     monkeypatch.setenv('DATABASE_PATH', ':memory:')
     monkeypatch.setenv('FLASK_ENV', 'testing')
+
+
+@pytest.fixture(autouse=True)
+def reset_tts_state():
+    """Drop the shared Google TTS client and known cache keys between tests."""
+    from app.services import tts_client
+
+    tts_client._speech_client = None
+    tts_client._KNOWN_KEYS.clear()
+    yield
+    tts_client._speech_client = None
+    tts_client._KNOWN_KEYS.clear()
@@ -77,3 +77,23 @@ class TestClaudeClient:
         
         assert "Topics: ALE, MS-DMT" in result
         assert "ALE: Important detail" in result
+    
+    @patch('app.services.claude_client.anthropic.Anthropic')
+    def test_send_tool_call_returns_tool_input(self, mock_anthropic):
+        """Test a forced tool call returns the parsed tool input."""
+        from app.services.claude_client import ClaudeClient
+        
+        mock_client = Mock()
+        mock_anthropic.return_value = mock_client
+        mock_response = Mock()
+        mock_response.content = [Mock(type="tool_use", input={"topics_discussed": ["ALE"]})]
+        mock_client.messages.create.return_value = mock_response
+        
+        tool = {"name": "record_extraction", "input_schema": {"type": "object"}}
+        client = ClaudeClient(api_key="test-key")
+        result = client.send_tool_call([{"role": "user", "content": "Hi"}], tool)
+        
+        call_kwargs = mock_client.messages.create.call_args.kwargs
+        assert result == {"topics_discussed": ["ALE"]}
+        assert call_kwargs["tools"] == [tool]
+        assert call_kwargs["tool_choice"] == {"type": "tool", "name": "record_extraction"}
@@ -19,6 +19,8 @@ class TestInterviewManager:
         
         tts_client = Mock()
         tts_client.synthesize.return_value = "/audio/test123.mp3"
+        tts_client.synthesize_joined.return_value = ("/audio/greeting.mp3", 100)
+        tts_client.calculate_cost.return_value = 0.0016
         
         return claude_client, tts_client
     
@@ -50,7 +52,66 @@ class TestInterviewManager:
         assert "greeting" in result
         assert "audio_url" in result
         assert "Test" in result["greeting"] or "W1TEST" in result["greeting"]
-        tts_client.synthesize.assert_called_once()
+        assert result["audio_url"] == "/audio/greeting.mp3"
+        tts_client.synthesize_joined.assert_called_once_with(
+            manager._greeting_segments("Test Expert", "W1TEST")
+        )
+    
+    @patch('app.services.interview_manager.get_db')
+    def test_stream_input_yields_sentences(self, mock_get_db, mock_clients, temp_db):
+        """Test streamed responses are synthesized sentence by sentence."""
+        from app.services.interview_manager import InterviewManager
+        from app.models.message import Message
+        
+        mock_get_db.return_value = temp_db
+        claude_client, tts_client = mock_clients
+        claude_client.stream_with_context.return_value = iter(
+            ["Thanks for that. How did", " ALE start? Tell me", " more"]
+        )
+        tts_client.synthesize.return_value = ("/audio/test123.mp3", 10)
+        tts_client.synthesize_joined.return_value = ("/audio/greeting.mp3", 100)
+        tts_client.calculate_cost.return_value = 0.0001
+        
+        manager = InterviewManager(claude_client, tts_client)
+        session_id = manager.create_session(expert_name="Test Expert")["session_id"]
+        
+        events = list(manager.stream_input(session_id, "I worked on ALE."))
+        
+        assert [e["text"] for e in events[:-1]] == [
+            "Thanks for that.", "How did ALE start?", "Tell me more"
+        ]
+        assert events[-1]["type"] == "done"
+        assert events[-1]["response_text"] == "Thanks for that. How did ALE start? Tell me more"
+        assert events[-1]["chars_this_response"] == 30
+        assert Message.count_by_session(temp_db, session_id) == 3
+    
+    @patch('app.services.interview_manager.get_db')
+    def test_stream_input_saves_partial_reply_on_close(self, mock_get_db, mock_clients, temp_db):
+        """Test a stream closed mid-reply still saves what was generated and its cost."""
+        from app.services.interview_manager import InterviewManager
+        from app.models.message import Message
+        from app.models.session import Session
+        
+        mock_get_db.return_value = temp_db
+        claude_client, tts_client = mock_clients
+        claude_client.stream_with_context.return_value = iter(
+            ["Thanks for that. How did", " ALE start?"]
+        )
+        tts_client.synthesize.return_value = ("/audio/test123.mp3", 10)
+        tts_client.synthesize_joined.return_value = ("/audio/greeting.mp3", 100)
+        tts_client.calculate_cost.side_effect = lambda chars: chars * 0.00001
+        
+        manager = InterviewManager(claude_client, tts_client)
+        session_id = manager.create_session(expert_name="Test Expert")["session_id"]
+        
+        stream = manager.stream_input(session_id, "I worked on ALE.")
+        assert next(stream)["text"] == "Thanks for that."
+        stream.close()
+        
+        messages = Message.get_by_session(temp_db, session_id)
+        assert [m["role"] for m in messages] == ["assistant", "user", "assistant"]
+        assert messages[-1]["content"] == "Thanks for that. How did"
+        assert Session.finalize(temp_db, session_id)["total_chars_synthesized"] == 110
     
     @patch('app.services.interview_manager.get_db')  
     def test_generate_greeting_with_callsign(self, mock_get_db, mock_clients):
@@ -81,6 +142,140 @@ class TestInterviewManager:
         )
         
         assert "ALE" in greeting or "expertise" in greeting
+    
+    @patch('app.services.interview_manager.TTSClient')
+    def test_tts_clients_are_bounded(self, mock_tts_class):
+        """Test TTS clients are shared per rounded rate and evicted when full."""
+        from app.services import interview_manager
+        from app.services.interview_manager import InterviewManager
+        
+        manager = InterviewManager(Mock())
+        
+        first = manager._get_tts_client("premium_female", 0.951)
+        assert manager._get_tts_client("premium_female", 0.949) is first
+        
+        for i in range(interview_manager._MAX_TTS_CLIENTS):
+            manager._get_tts_client("premium_female", 1.0 + i / 100)
+        
+        assert len(manager._tts_clients) == interview_manager._MAX_TTS_CLIENTS
+        assert ("premium_female", 0.95) not in manager._tts_clients
+    
+    def test_session_cache_prunes_and_is_bounded(self, mock_clients):
+        """Test expired session rows are dropped and the cache stays bounded."""
+        from app.services import interview_manager
+        
+        claude_client, tts_client = mock_clients
+        manager = interview_manager.InterviewManager(claude_client, tts_client)
+        
+        with patch('app.services.interview_manager.time.monotonic', return_value=0):
+            manager._cache_session({"id": "old"})
+        with patch('app.services.interview_manager.time.monotonic',
+                   return_value=interview_manager._SESSION_CACHE_TTL + 1):
+            for i in range(interview_manager._MAX_CACHED_SESSIONS + 1):
+                manager._cache_session({"id": f"s{i}"})
+        
+        assert "old" not in manager._sessions
+        assert "s0" not in manager._sessions
+        assert len(manager._sessions) == interview_manager._MAX_CACHED_SESSIONS
+    
+    def test_schedule_extraction_skips_while_pending(self, mock_clients):
+        """Test a session runs at most one background extraction at a time."""
+        import threading
+        from app.services.interview_manager import InterviewManager
+        
+        claude_client, tts_client = mock_clients
+        manager = InterviewManager(claude_client, tts_client)
+        release = threading.Event()
+        manager._run_extraction = Mock(side_effect=lambda session_id: release.wait(5))
+        
+        assert manager._schedule_extraction("s1") is True
+        assert manager._schedule_extraction("s1") is False
+        
+        release.set()
+        manager._wait_for_extraction("s1")
+        
+        manager._run_extraction.assert_called_once_with("s1")
+    
+    @patch('app.services.interview_manager.get_db')
+    def test_run_extraction_pages_and_keeps_failed_messages(self, mock_get_db, mock_clients, temp_db):
+        """Test extraction covers every new message and retries ones that failed."""
+        from app.services.interview_manager import InterviewManager
+        from app.models.session import Session
+        from app.models.message import Message
+        
+        mock_get_db.return_value = temp_db
+        claude_client, tts_client = mock_clients
+        manager = InterviewManager(claude_client, tts_client)
+        manager.context_manager.extraction_interval = 1
+        manager.extractor.extract = Mock(side_effect=lambda chunk, existing: {
+            "topics_discussed": [m["content"] for m in chunk]
+        })
+        
+        Session.create(temp_db, "s-pages", "Test Expert")
+        ids = [Message.create(temp_db, "s-pages", "user", f"Topic {i}")["id"] for i in range(10)]
+        
+        manager._run_extraction("s-pages")
+        
+        session = Session.get_by_id(temp_db, "s-pages")
+        assert session["last_extracted_message_id"] == ids[-1]
+        assert session["extracted_knowledge"]["topics_discussed"] == [f"Topic {i}" for i in range(10)]
+        
+        Message.create(temp_db, "s-pages", "user", "Topic 10")
+        manager.extractor.extract = Mock(return_value=None)
+        manager._run_extraction("s-pages")
+        
+        assert Session.get_by_id(temp_db, "s-pages")["last_extracted_message_id"] == ids[-1]
+    
+    @patch('app.services.interview_manager.get_db')
+    def test_cost_update_keeps_newer_cached_session(self, mock_get_db, mock_clients, temp_db):
+        """Test a turn's cost update doesn't overwrite a row an extraction cached mid-turn."""
+        from app.services.interview_manager import InterviewManager
+        from app.models.session import Session
+        
+        mock_get_db.return_value = temp_db
+        claude_client, tts_client = mock_clients
+        tts_client.calculate_cost.return_value = 0.001
+        manager = InterviewManager(claude_client, tts_client)
+        manager._get_session(temp_db, Session.create(temp_db, "s-cost", "Test Expert")["id"])
+        
+        real_update_cost = Session.update_cost
+        
+        def update_cost_during_extraction(db, session_id, chars, cost, current=None):
+            manager._cache_session(Session.update(
+                db, session_id, extracted_knowledge={"topics_discussed": ["ALE"]},
+                last_extracted_message_id=7
+            ))
+            return real_update_cost(db, session_id, chars, cost, current=current)
+        
+        with patch.object(Session, 'update_cost', side_effect=update_cost_during_extraction):
+            result = manager._finish_turn(temp_db, "s-cost", tts_client, 100, 0)
+        
+        cached = manager._get_session(temp_db, "s-cost")
+        assert cached["last_extracted_message_id"] == 7
+        assert cached["extracted_knowledge"] == {"topics_discussed": ["ALE"]}
+        assert cached["total_chars_synthesized"] == result["total_chars"] == 100
+    
+    def test_schedule_extraction_already_finished(self, mock_clients):
+        """Test scheduling doesn't deadlock when the job finishes before its callback is added."""
+        import threading
+        from concurrent.futures import Future
+        from app.services import interview_manager
+        
+        claude_client, tts_client = mock_clients
+        manager = interview_manager.InterviewManager(claude_client, tts_client)
+        done = Future()
+        done.set_result(None)
+        results = []
+        
+        with patch.object(interview_manager._extraction_pool, 'submit', return_value=done):
+            worker = threading.Thread(
+                target=lambda: results.append(manager._schedule_extraction("s1")), daemon=True
+            )
+            worker.start()
+            worker.join(5)
+        
+        assert results == [True]
+        assert "s1" not in manager._extractions
 
 
 class TestContextManager:
@@ -176,3 +371,34 @@ class TestKnowledgeExtractor:
         result = extractor._extract_json_from_text(text)
         
         assert result["topics_discussed"] == ["test"]
+    
+    def test_extract_parallel_merges_chunks(self):
+        """Test long windows are extracted per chunk and merged in order."""
+        from app.services.knowledge_extractor import KnowledgeExtractor
+        
+        extractor = KnowledgeExtractor(Mock())
+        extractor.extract = Mock(side_effect=lambda chunk, existing: {
+            "topics_discussed": [chunk[0]["content"]]
+        })
+        messages = [{"role": "user", "content": f"Topic {i}"} for i in range(5)]
+        
+        result, covered = extractor.extract_parallel(messages, {"topics_discussed": ["ALE"]}, chunk_size=2)
+        
+        assert extractor.extract.call_count == 3
+        assert result["topics_discussed"] == ["ALE", "Topic 0", "Topic 2", "Topic 4"]
+        assert covered == 5
+    
+    def test_extract_parallel_stops_at_failed_chunk(self):
+        """Test chunks from the first failed extraction on are left uncovered."""
+        from app.services.knowledge_extractor import KnowledgeExtractor
+        
+        extractor = KnowledgeExtractor(Mock())
+        extractor.extract = Mock(side_effect=lambda chunk, existing: None
+                                 if chunk[0]["content"] == "Topic 2"
+                                 else {"topics_discussed": [chunk[0]["content"]]})
+        messages = [{"role": "user", "content": f"Topic {i}"} for i in range(5)]
+        
+        result, covered = extractor.extract_parallel(messages, None, chunk_size=2)
+        
+        assert result["topics_discussed"] == ["Topic 0"]
+        assert covered == 2
@@ -0,0 +1,266 @@
+"""
+Tests for Session and Message models.
+"""
+
+import pytest
+import tempfile
+import os
+from unittest.mock import patch
+
+
+@pytest.fixture
+def db():
+    """Create a fresh database for each test."""
+    from app.models.database import init_db, get_db, close_db
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "test.db")
+        with patch('app.config.Config.DATABASE_PATH', db_path):
+            close_db()
+            init_db()
+            yield get_db()
+            close_db()
+
+
+class TestSession:
+    """Test cases for Session model."""
+
+    def test_create_returns_session(self, db):
+        """Test create returns the stored row with decoded topics."""
+        from app.models.session import Session
+
+        session = Session.create(db, "s1", "Test Expert", topics=["ALE"])
+
+        assert session["id"] == "s1"
+        assert session["topics"] == ["ALE"]
+        assert session["total_chars_synthesized"] == 0
+
+    def test_update_returns_updated_session(self, db):
+        """Test update returns the row as written."""
+        from app.models.session import Session
+
+        Session.create(db, "s1", "Test Expert")
+        session = Session.update(db, "s1", status="completed",
+                                 extracted_knowledge={"topics_discussed": ["ALE"]})
+
+        assert session["status"] == "completed"
+        assert session["extracted_knowledge"] == {"topics_discussed": ["ALE"]}
+
+    def test_reads_return_independent_json_values(self, db):
+        """Test editing a returned session's JSON fields doesn't affect later reads."""
+        from app.models.session import Session
+
+        Session.create(db, "s1", "Test Expert", topics=["ALE"])
+
+        session = Session.get_by_id(db, "s1")
+        session["topics"].append("MS-DMT")
+
+        assert Session.get_by_id(db, "s1")["topics"] == ["ALE"]
+
+    def test_update_missing_session_returns_none(self, db):
+        """Test updating an unknown session returns None."""
+        from app.models.session import Session
+
+        assert Session.update(db, "missing", status="completed") is None
+
+    def test_delete_removes_messages(self, db):
+        """Test delete removes the session and its messages."""
+        from app.models.session import Session
+        from app.models.message import Message
+
+        Session.create(db, "s1", "Test Expert")
+        Message.create(db, "s1", "user", "Hello")
+
+        assert Session.delete(db, "s1") is True
+        assert Session.get_by_id(db, "s1") is None
+        assert Message.count_by_session(db, "s1") == 0
+
+    def test_update_cost_accumulates(self, db):
+        """Test cost tracking increments totals."""
+        from app.models.session import Session
+
+        Session.create(db, "s1", "Test Expert")
+        Session.update_cost(db, "s1", 100, 0.001)
+        session = Session.update_cost(db, "s1", 50, 0.0005)
+
+        assert session["total_chars_synthesized"] == 150
+        assert session["estimated_cost"] == pytest.approx(0.0015)
+
+    def test_update_cost_applies_to_current_session(self, db):
+        """Test buffered increments are applied to a passed-in session dict."""
+        from app.models.session import Session
+
+        session = Session.create(db, "s1", "Test Expert")
+
+        with patch.object(Session, 'get_by_id') as mock_get:
+            updated = Session.update_cost(db, "s1", 100, 0.001, current=session)
+            mock_get.assert_not_called()
+
+        assert updated["total_chars_synthesized"] == 100
+        assert updated == Session.get_by_id(db, "s1")
+
+    def test_get_all_summary_projects_listing_fields(self, db):
+        """Test session summaries carry only the listing columns."""
+        from app.models.session import Session
+
+        Session.create(db, "s1", "Test Expert", topics=["ALE"])
+
+        summaries = Session.get_all_summary(db)
+
+        assert summaries == [{
+            "id": "s1",
+            "expert_name": "Test Expert",
+            "expert_callsign": None,
+            "status": "active",
+            "message_count": 0,
+            "created_at": summaries[0]["created_at"],
+        }]
+
+    def test_finalize_writes_buffered_cost(self, db):
+        """Test small cost increments are buffered until finalize."""
+        from app.models.session import Session
+
+        Session.create(db, "s1", "Test Expert")
+        Session.update_cost(db, "s1", 100, 0.001)
+
+        stored = db.execute(
+            "SELECT total_chars_synthesized FROM sessions WHERE id = ?", ("s1",)
+        ).fetchone()[0]
+        assert stored == 0
+
+        session = Session.finalize(db, "s1")
+        stored = db.execute(
+            "SELECT total_chars_synthesized FROM sessions WHERE id = ?", ("s1",)
+        ).fetchone()[0]
+
+        assert stored == 100
+        assert session["total_chars_synthesized"] == 100
+
+
+class TestMessage:
+    """Test cases for Message model."""
+
+    def test_create_returns_message(self, db):
+        """Test create returns the stored row."""
+        from app.models.session import Session
+        from app.models.message import Message
+
+        Session.create(db, "s1", "Test Expert")
+        message = Message.create(db, "s1", "user", "Hello")
+
+        assert message["id"] is not None
+        assert message["role"] == "user"
+        assert message["content"] == "Hello"
+
+    def test_create_many_inserts_all(self, db):
+        """Test batch insert stores every row."""
+        from app.models.session import Session
+        from app.models.message import Message
+
+        Session.create(db, "s1", "Test Expert")
+        created = Message.create_many(db, "s1", [
+            ("user", "Question?", None),
+            ("assistant", "Answer.", "/audio/abc.mp3"),
+        ])
+
+        assert created == 2
+        assert Message.count_by_session(db, "s1") == 2
+
+    def test_get_recent_is_chronological(self, db):
+        """Test recent messages come back oldest first."""
+        from app.models.session import Session
+        from app.models.message import Message
+
+        Session.create(db, "s1", "Test Expert")
+        for i in range(5):
+            Message.create(db, "s1", "user", f"Message {i}")
+
+        recent = Message.get_recent(db, "s1", limit=3)
+
+        assert [m["content"] for m in recent] == ["Message 2", "Message 3", "Message 4"]
+
+    def test_get_roles_contents_projects_fields(self, db):
+        """Test Claude-format fetch returns only role and content."""
+        from app.models.session import Session
+        from app.models.message import Message
+
+        Session.create(db, "s1", "Test Expert")
+        Message.create(db, "s1", "assistant", "Welcome")
+        Message.create(db, "s1", "user", "Thanks")
+        Message.create(db, "s1", "assistant", "First question")
+
+        messages = Message.get_roles_contents(db, "s1", limit=2)
+
+        assert messages == [
+            {"role": "user", "content": "Thanks"},
+            {"role": "assistant", "content": "First question"},
+        ]
+
+    def test_iter_by_session_streams_in_order(self, db):
+        """Test streaming yields every message across batch boundaries."""
+        from app.models.session import Session
+        from app.models.message import Message
+
+        Session.create(db, "s1", "Test Expert")
+        for i in range(5):
+            Message.create(db, "s1", "user", f"Message {i}")
+
+        streamed = Message.iter_by_session(db, "s1", batch_size=2)
+
+        assert [m["content"] for m in streamed] == [f"Message {i}" for i in range(5)]
+
+    def test_get_since_skips_extracted_messages(self, db):
+        """Test only messages after the given ID are returned."""
+        from app.models.session import Session
+        from app.models.message import Message
+
+        Session.create(db, "s1", "Test Expert")
+        first = Message.create(db, "s1", "assistant", "Welcome")
+        Message.create(db, "s1", "user", "Thanks")
+
+        messages = Message.get_since(db, "s1", after_id=first["id"])
+
+        assert [m["content"] for m in messages] == ["Thanks"]
+        assert Message.get_since(db, "s1", after_id=messages[-1]["id"]) == []
+
+    def test_get_since_pages_from_oldest(self, db):
+        """Test a limited fetch returns the oldest unextracted messages."""
+        from app.models.session import Session
+        from app.models.message import Message
+
+        Session.create(db, "s1", "Test Expert")
+        for i in range(5):
+            Message.create(db, "s1", "user", f"Message {i}")
+
+        page = Message.get_since(db, "s1", after_id=0, limit=2)
+        rest = Message.get_since(db, "s1", after_id=page[-1]["id"], limit=10)
+
+        assert [m["content"] for m in page] == ["Message 0", "Message 1"]
+        assert [m["content"] for m in rest] == ["Message 2", "Message 3", "Message 4"]
+
+    def test_get_window_counts_whole_session(self, db):
+        """Test the context window comes back with the full message count."""
+        from app.models.session import Session
+        from app.models.message import Message
+
+        Session.create(db, "s1", "Test Expert")
+        for i in range(5):
+            Message.create(db, "s1", "user", f"Message {i}")
+
+        messages, total = Message.get_window(db, "s1", limit=2)
+
+        assert [m["content"] for m in messages] == ["Message 3", "Message 4"]
+        assert total == 5
+        assert Message.get_window(db, "missing", limit=2) == ([], 0)
+
+    def test_get_session_stats(self, db):
+        """Test stats report the message time span and count."""
+        from app.models.session import Session
+        from app.models.message import Message
+
+        Session.create(db, "s1", "Test Expert")
+        first = Message.create(db, "s1", "assistant", "Welcome")
+        last = Message.create(db, "s1", "user", "Thanks")
+
+        assert Message.get_session_stats(db, "s1") == (first["created_at"], last["created_at"], 2)
+        assert Message.get_session_stats(db, "missing") == (None, None, 0)
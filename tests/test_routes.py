@@ -0,0 +1,97 @@
+"""
+Tests for API routes.
+"""
+
+import pytest
+import os
+import tempfile
+from unittest.mock import patch
+
+
+@pytest.fixture
+def client():
+    """Create a test client with auth required and fresh data stores."""
+    from app.main import create_app
+    from app.models.database import close_db
+    from app.services import token_manager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with patch('app.config.Config.DATABASE_PATH', os.path.join(tmpdir, "test.db")), \
+             patch('app.config.Config.TOKENS_DB', os.path.join(tmpdir, "tokens.db")), \
+             patch('app.config.Config.TOKENS_FILE', os.path.join(tmpdir, "tokens.json")), \
+             patch('app.config.Config.REQUIRE_AUTH', True):
+            close_db()
+            token_manager._token_cache.clear()
+            token_manager._local.db = None
+            app = create_app()
+            app.testing = True
+            yield app.test_client()
+            close_db()
+            token_manager._token_cache.clear()
+            cached = getattr(token_manager._local, "db", None)
+            if cached:
+                cached[1].close()
+                token_manager._local.db = None
+
+
+class TestAuth:
+    """Test cases for authentication."""
+
+    def test_revoked_token_loses_api_access(self, client):
+        """Test a logged-in session is rejected once its token is revoked."""
+        from app.services.token_manager import add_token, revoke_token
+
+        token = add_token("Test User")
+        assert client.post('/api/auth', json={'token': token}).status_code == 200
+        assert client.get('/api/sessions').status_code == 200
+
+        revoke_token(token)
+
+        assert client.get('/api/sessions').status_code == 401
+        with client.session_transaction() as session:
+            assert 'uid' not in session
+
+
+class TestInputValidation:
+    """Test cases for request body validation."""
+
+    @pytest.mark.parametrize("path", ['/api/interview', '/api/interview/stream'])
+    @pytest.mark.parametrize("body", [
+        ["not", "an", "object"],
+        {"session_id": "s1", "text": None},
+        {"session_id": "s1", "text": 5},
+        {"session_id": ["s1"], "text": "Hello"},
+    ])
+    def test_interview_rejects_malformed_body(self, client, path, body):
+        """Test malformed interview input is a 400, not a server error."""
+        from app.services.token_manager import add_token
+
+        client.post('/api/auth', json={'token': add_token("Test User")})
+
+        response = client.post(path, json=body)
+
+        assert response.status_code == 400
+        assert "error" in response.get_json()
+
+    @pytest.mark.parametrize("body", [["Test Expert"], {"expert_name": 5}])
+    def test_create_session_rejects_malformed_body(self, client, body):
+        """Test malformed session input is a 400, not a server error."""
+        from app.services.token_manager import add_token
+
+        client.post('/api/auth', json={'token': add_token("Test User")})
+
+        assert client.post('/api/sessions', json=body).status_code == 400
+
+
+class TestAudio:
+    """Test cases for audio serving."""
+
+    def test_missing_audio_is_forgotten_by_tts_cache(self, client):
+        """Test a 404 for known audio drops it from the TTS cache's known keys."""
+        from app.config import Config
+        from app.services import tts_client
+
+        tts_client._KNOWN_KEYS[Config.AUDIO_CACHE_DIR] = {"deadbeef"}
+
+        assert client.get('/audio/deadbeef.mp3').status_code == 404
+        assert tts_client._KNOWN_KEYS[Config.AUDIO_CACHE_DIR] == set()
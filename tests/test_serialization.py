@@ -0,0 +1,31 @@
+"""
+Tests for JSON serialization helpers.
+"""
+
+import json
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+
+class TestOrjsonProvider:
+    """Test cases for OrjsonProvider."""
+
+    @pytest.mark.parametrize("args, kwargs", [
+        (({"b": 1, "a": {"d": 2, "c": 3}},), {}),
+        ((1, 2), {}),
+        ((), {"b": 1, "a": 2}),
+    ])
+    def test_response_matches_default_provider(self, args, kwargs):
+        """Test responses decode to the same data with the same key order."""
+        from app.serialization import OrjsonProvider
+
+        app = Flask(__name__)
+        with app.app_context():
+            expected = DefaultJSONProvider(app).response(*args, **kwargs).get_data(as_text=True)
+            actual = OrjsonProvider(app).response(*args, **kwargs).get_data(as_text=True)
+
+        assert json.loads(actual) == json.loads(expected)
+        assert list(json.loads(actual, object_pairs_hook=lambda pairs: pairs)) == \
+            list(json.loads(expected, object_pairs_hook=lambda pairs: pairs))
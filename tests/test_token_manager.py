@@ -0,0 +1,165 @@
+"""
+Tests for token management.
+"""
+
+import pytest
+import os
+import tempfile
+from unittest.mock import patch
+
+
+@pytest.fixture
+def tokens_file():
+    """Point the token store at a fresh database for each test."""
+    from app.services import token_manager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "tokens.json")
+        with patch('app.config.Config.TOKENS_FILE', path), \
+             patch('app.config.Config.TOKENS_DB', os.path.join(tmpdir, "tokens.db")):
+            token_manager._token_cache.clear()
+            yield path
+            token_manager._token_cache.clear()
+            cached = getattr(token_manager._local, "db", None)
+            if cached:
+                cached[1].close()
+                token_manager._local.db = None
+
+
+class TestTokenManager:
+    """Test cases for token management."""
+
+    def test_validate_active_token(self, tokens_file):
+        """Test a newly added token validates to its user info."""
+        from app.services.token_manager import add_token, validate_token
+
+        token = add_token("Test User", "W1AW")
+        user_info = validate_token(token)
+
+        assert user_info["name"] == "Test User"
+        assert user_info["callsign"] == "W1AW"
+
+    def test_validate_unknown_token(self, tokens_file):
+        """Test an unknown token is rejected."""
+        from app.services.token_manager import validate_token
+
+        assert validate_token("not-a-token") is None
+
+    def test_revoked_token_not_served_from_cache(self, tokens_file):
+        """Test revoking a token invalidates the cached validation."""
+        from app.services.token_manager import add_token, validate_token, revoke_token
+
+        token = add_token("Test User")
+        assert validate_token(token) is not None
+
+        revoke_token(token)
+
+        assert validate_token(token) is None
+
+    def test_repeat_validation_uses_cache(self, tokens_file):
+        """Test a cached token skips the token database."""
+        from app.services import token_manager
+
+        token = token_manager.add_token("Test User")
+        token_manager.validate_token(token)
+
+        with patch.object(token_manager, '_connect') as mock_connect:
+            assert token_manager.validate_token(token)["name"] == "Test User"
+            mock_connect.assert_not_called()
+
+    def test_get_user_by_token_id(self, tokens_file):
+        """Test user info resolves from the token id after a cache miss."""
+        from app.services import token_manager
+
+        token = token_manager.add_token("Test User", "W1AW")
+        token_manager._token_cache.clear()
+
+        user_info = token_manager.get_user(token_manager.token_id(token))
+
+        assert user_info["callsign"] == "W1AW"
+        assert token_manager.get_user("unknown-id") is None
+
+    def test_revocation_from_another_connection(self, tokens_file):
+        """Test a revocation written by another process is seen after a cache miss."""
+        import sqlite3
+        from app.config import Config
+        from app.services import token_manager
+
+        token = token_manager.add_token("Test User")
+        assert token_manager.validate_token(token) is not None
+
+        other = sqlite3.connect(Config.TOKENS_DB)
+        other.execute("UPDATE tokens SET active = 0")
+        other.commit()
+        other.close()
+        token_manager._token_cache.clear()
+
+        assert token_manager.validate_token(token) is None
+
+    def test_legacy_json_file_is_imported(self, tokens_file):
+        """Test a legacy tokens file, plaintext or hashed, is imported once."""
+        import json
+        from app.services import token_manager
+
+        with open(tokens_file, "w") as f:
+            json.dump({"tokens": {"legacy-token": {
+                "name": "Legacy User", "created": "2024-01-01T00:00:00", "active": True
+            }}}, f)
+
+        assert token_manager.validate_token("legacy-token")["name"] == "Legacy User"
+        assert not os.path.exists(tokens_file)
+        assert os.path.exists(tokens_file + ".imported")
+
+        hashed_id = token_manager.token_id("hashed-token")
+        with open(tokens_file, "w") as f:
+            json.dump({"hashed": True, "tokens": {hashed_id: {
+                "name": "Hashed User", "created": "2024-01-01T00:00:00", "active": True
+            }}}, f)
+        token_manager._local.db[1].close()
+        token_manager._local.db = None
+
+        assert token_manager.get_user(hashed_id)["name"] == "Hashed User"
+        assert token_manager.validate_token("legacy-token") is not None
+
+    def test_import_tolerates_concurrent_import(self, tokens_file):
+        """Test a tokens file imported and renamed by another worker isn't an error."""
+        import json
+        from pathlib import Path
+        from app.services import token_manager
+
+        db = token_manager._connect()
+
+        # Renamed after this worker saw it, before it could open it
+        with patch.object(Path, 'exists', return_value=True):
+            token_manager._import_json(db, Path(tokens_file))
+
+        # Renamed by another worker between this one's import and rename
+        with open(tokens_file, "w") as f:
+            json.dump({"tokens": {"legacy-token": {"name": "Legacy User"}}}, f)
+        with patch('app.services.token_manager.os.replace', side_effect=FileNotFoundError):
+            token_manager._import_json(db, Path(tokens_file))
+
+        assert token_manager.validate_token("legacy-token")["name"] == "Legacy User"
+
+    def test_find_tokens_by_token_or_prefix(self, tokens_file):
+        """Test tokens are found by full token or by token_id prefix."""
+        from app.services import token_manager
+
+        token = token_manager.add_token("Test User")
+        user_id = token_manager.token_id(token)
+        token_manager.add_token("Other User")
+
+        assert [t["name"] for t in token_manager.find_tokens(token)] == ["Test User"]
+        assert [t["token_id"] for t in token_manager.find_tokens(user_id[:12].upper())] == [user_id]
+        assert len(token_manager.find_tokens("")) == 2
+        assert token_manager.find_tokens("zz") == []
+
+    def test_add_tokens_creates_distinct_tokens(self, tokens_file):
+        """Test bulk-created tokens are unique and each validates."""
+        from app.services import token_manager
+
+        tokens = token_manager.add_tokens([("User A", None), ("User B", "W1AW")])
+
+        assert len(set(tokens)) == 2
+        assert all(len(token) == len(token_manager.generate_token()) for token in tokens)
+        assert token_manager.validate_token(tokens[1])["callsign"] == "W1AW"
@@ -96,3 +96,158 @@ class TestTTSClient:
             
             assert deleted == 2
             assert len(os.listdir(tmpdir)) == 0
+    
+    @patch('app.services.tts_client.texttospeech.TextToSpeechClient')
+    def test_synthesize_joined_reuses_shared_segments(self, mock_tts_class):
+        """Test joined audio only synthesizes segments not cached yet."""
+        from app.services.tts_client import TTSClient
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_client = Mock()
+            mock_tts_class.return_value = mock_client
+            mock_client.synthesize_speech.side_effect = lambda input, **kwargs: Mock(
+                audio_content=input.text.encode()
+            )
+            
+            client = TTSClient(cache_dir=tmpdir)
+            
+            url, chars = client.synthesize_joined(["Hello Al. ", "Welcome."])
+            client.synthesize_joined(["Hello Bo. ", "Welcome."])
+            
+            assert chars == len("Hello Al. Welcome.")
+            assert mock_client.synthesize_speech.call_count == 3
+            with open(client.get_audio_path(url), "rb") as f:
+                assert f.read() == b"Hello Al.Welcome."
+    
+    @patch('app.services.tts_client.texttospeech.TextToSpeechClient')
+    def test_identical_audio_shares_one_file(self, mock_tts_class):
+        """Test texts that produce the same audio are stored once."""
+        from app.services.tts_client import TTSClient
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_client = Mock()
+            mock_tts_class.return_value = mock_client
+            mock_response = Mock()
+            mock_response.audio_content = b"same audio"
+            mock_client.synthesize_speech.return_value = mock_response
+            
+            client = TTSClient(cache_dir=tmpdir)
+            
+            url1, _ = client.synthesize("Hello")
+            url2, _ = client.synthesize("Hello!")
+            
+            assert url1 != url2
+            assert os.path.samefile(client.get_audio_path(url1), client.get_audio_path(url2))
+    
+    @patch('app.services.tts_client.texttospeech.TextToSpeechClient')
+    def test_cache_hit_skips_stat(self, mock_tts_class):
+        """Test known cache keys are served without touching the filesystem."""
+        from app.services.tts_client import TTSClient
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_client = Mock()
+            mock_tts_class.return_value = mock_client
+            mock_response = Mock()
+            mock_response.audio_content = b"audio"
+            mock_client.synthesize_speech.return_value = mock_response
+            
+            client = TTSClient(cache_dir=tmpdir)
+            url1, _ = client.synthesize("Cached text")
+            
+            with patch('app.services.tts_client.os.path.exists') as mock_exists:
+                url2, _ = client.synthesize("Cached text")
+                mock_exists.assert_not_called()
+            
+            assert url1 == url2
+    
+    @patch('app.services.tts_client.texttospeech.TextToSpeechClient')
+    def test_init_preloads_existing_cache(self, mock_tts_class):
+        """Test audio cached by an earlier process is known before the first lookup."""
+        from app.services import tts_client
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "abc123.mp3"), "wb") as f:
+                f.write(b"audio")
+            
+            tts_client.TTSClient(cache_dir=tmpdir, preload=False)
+            assert tmpdir not in tts_client._KNOWN_KEYS
+            
+            tts_client.TTSClient(cache_dir=tmpdir)
+            assert tts_client._KNOWN_KEYS[tmpdir] == {"abc123"}
+    
+    @patch('app.services.tts_client.texttospeech.TextToSpeechClient')
+    def test_synthesize_skips_api_if_cached_while_waiting(self, mock_tts_class):
+        """Test audio written by another process while waiting for the lock is reused."""
+        from app.services.tts_client import TTSClient
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_client = Mock()
+            mock_tts_class.return_value = mock_client
+            
+            client = TTSClient(cache_dir=tmpdir)
+            with patch.object(client, '_is_cached', side_effect=[False, True]):
+                url, chars = client.synthesize("Racing text")
+            
+            mock_client.synthesize_speech.assert_not_called()
+            assert url == f"/audio/{client._cache_key('Racing text')}.mp3"
+            assert chars == len("Racing text")
+    
+    @patch('app.services.tts_client.texttospeech.TextToSpeechClient')
+    def test_synthesize_joined_recreates_deleted_segment(self, mock_tts_class):
+        """Test a cached segment deleted out of band is synthesized again."""
+        from app.services.tts_client import TTSClient
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_client = Mock()
+            mock_tts_class.return_value = mock_client
+            mock_client.synthesize_speech.side_effect = lambda input, **kwargs: Mock(
+                audio_content=input.text.encode()
+            )
+            
+            client = TTSClient(cache_dir=tmpdir)
+            url, _ = client.synthesize("Hello.")
+            os.unlink(client.get_audio_path(url))
+            
+            joined_url, _ = client.synthesize_joined(["Hello. ", "Bye."])
+            
+            with open(client.get_audio_path(joined_url), "rb") as f:
+                assert f.read() == b"Hello.Bye."
+            assert os.path.exists(client.get_audio_path(url))
+    
+    @patch('app.services.tts_client.texttospeech.TextToSpeechClient')
+    def test_clear_cache_keeps_recent_temp_files(self, mock_tts_class):
+        """Test only abandoned temp files are removed, not in-progress writes."""
+        from app.services.tts_client import TTSClient
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = TTSClient(cache_dir=tmpdir)
+            stale = os.path.join(tmpdir, "old.mp3.1.1.tmp")
+            recent = os.path.join(tmpdir, "new.mp3.1.2.tmp")
+            for path in (stale, recent):
+                with open(path, "wb") as f:
+                    f.write(b"partial")
+            os.utime(stale, (0, 0))
+            
+            client.clear_cache()
+            
+            assert not os.path.exists(stale)
+            assert os.path.exists(recent)
+    
+    @patch('app.services.tts_client.texttospeech.TextToSpeechClient')
+    def test_synthesize_many_keeps_order_and_dedupes(self, mock_tts_class):
+        """Test batch synthesis returns results in order, one API call per text."""
+        from app.services.tts_client import TTSClient
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_client = Mock()
+            mock_tts_class.return_value = mock_client
+            mock_client.synthesize_speech.side_effect = lambda input, **kwargs: Mock(
+                audio_content=input.text.encode()
+            )
+            
+            client = TTSClient(cache_dir=tmpdir)
+            results = client.synthesize_many(["One", "Two", "One"])
+            
+            assert [chars for _, chars in results] == [3, 3, 3]
+            assert results[0][0] == results[2][0] != results[1][0]
+            assert mock_client.synthesize_speech.call_count == 2